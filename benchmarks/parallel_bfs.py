@@ -0,0 +1,66 @@
+#time parallel_bfs on a random graph for 1..N worker processes
+#run from the repository root:
+#    python -m benchmarks.parallel_bfs --nodes 2000000 --degree 8 --workers 8
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from uninformed_search import CSRGraph, bfs_tree
+from uninformed_search.level_bfs import parallel_bfs
+
+
+def serial_tree(graph, source):
+    # hop counts and parents of the one-node-at-a-time bfs_tree, as arrays
+    order, parents = bfs_tree(graph, source)
+    cost = np.full(graph.num_nodes, -1, dtype=np.int64)
+    parent = np.full(graph.num_nodes, -1, dtype=np.int64)
+    cost[source] = 0
+    # every node is discovered after its parent, so walking the parents
+    # in discovery order sees each parent's cost first
+    for node, up in parents.items():
+        if up is not None:
+            cost[node] = cost[up] + 1
+            parent[node] = up
+    return cost, parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parallel BFS scaling benchmark")
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--degree", type=int, default=8, help="average out-degree")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    edges = args.nodes * args.degree
+    start = time.perf_counter()
+    graph = CSRGraph.from_edges(args.nodes, rng.integers(0, args.nodes, edges),
+                                rng.integers(0, args.nodes, edges))
+    print(f"graph: {graph.num_nodes} nodes, {graph.num_edges} edges "
+          f"(built in {time.perf_counter() - start:.2f}s)")
+
+    start = time.perf_counter()
+    cost, parent = serial_tree(graph, 0)
+    print(f"serial bfs_tree  {time.perf_counter() - start:8.2f}s")
+
+    baseline = None
+    counts = [1 << i for i in range(args.workers.bit_length()) if 1 << i < args.workers]
+    for workers in counts + [args.workers]:
+        start = time.perf_counter()
+        tree = parallel_bfs(graph, 0, workers=workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        # every worker count must give the serial distances and parents
+        assert np.array_equal(tree.cost, cost)
+        assert np.array_equal(tree.parent, parent)
+        print(f"workers={workers:3d}  {elapsed:8.2f}s  speedup {baseline / elapsed:5.2f}x  "
+              f"reached {len(tree)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Importable, side-effect free versions of the uninformed search scripts.
+
+The algorithms are plain functions; the plotting helpers live in
+``uninformed_search.visualize`` and import matplotlib/networkx lazily.  The
+process-pool entry points are loaded on first use, so importing the package
+does not pull in ``multiprocessing``.
+"""
+
+import importlib
+
+from .bfs import bfs_path, bfs_states, bfs_steps, bfs_tree
+from .bidirectional import bidirectional_bfs, bidirectional_path, join_paths
+from .cache import PathCache
+from .depth_limited import TranspositionTable, depth_limited_search_path, iter_depth_limited_solutions
+from .dynamic import DynamicShortestPaths
+from .events import EventLog, Replay
+from .dfs import dfs_recursive, dfs_with_trace
+from .generators import gen_graph, gnp_csr, gnp_edges, random_maze, random_weighted_graph
+from .graph import CSRGraph
+from .grid_bfs import grid_bfs
+from .iterative_deepening import depth_limited_search, iterative_deepening_search
+from .layout_cache import LayoutCache
+from .problem import GridProblem, Problem
+from .spt import ShortestPathTree, shortest_path_tree
+from .ucs import bidirectional_ucs, reverse_adjacency, uniform_cost_search
+
+# name -> submodule, imported by __getattr__ the first time it is asked for
+_LAZY = {
+    "BatchQueryEngine": "batch",
+    "SharedCSRGraph": "batch",
+    "batch_query": "batch",
+    "parallel_bfs": "level_bfs",
+    "parallel_iterative_deepening_search": "parallel_ids",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+__all__ = [
+    "BatchQueryEngine",
+    "CSRGraph",
+    "DynamicShortestPaths",
+    "EventLog",
+    "GridProblem",
+    "LayoutCache",
+    "PathCache",
+    "Problem",
+    "Replay",
+    "SharedCSRGraph",
+    "ShortestPathTree",
+    "TranspositionTable",
+    "batch_query",
+    "bfs_path",
+    "bfs_states",
+    "bfs_steps",
+    "bfs_tree",
+    "bidirectional_bfs",
+    "bidirectional_path",
+    "bidirectional_ucs",
+    "depth_limited_search",
+    "depth_limited_search_path",
+    "dfs_recursive",
+    "dfs_with_trace",
+    "gen_graph",
+    "gnp_csr",
+    "gnp_edges",
+    "grid_bfs",
+    "iter_depth_limited_solutions",
+    "iterative_deepening_search",
+    "join_paths",
+    "parallel_bfs",
+    "parallel_iterative_deepening_search",
+    "random_maze",
+    "random_weighted_graph",
+    "reverse_adjacency",
+    "shortest_path_tree",
+    "uniform_cost_search",
+]
@@ -0,0 +1,162 @@
+#batch path queries fanned out to a process pool
+#the graph is copied once into shared memory and every worker maps the same
+#CSR arrays, so tasks only carry (start, goal) pairs
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .bfs import bfs_path
+from .graph import CSRGraph
+from .ucs import uniform_cost_search
+
+METHODS = {
+    "ucs": uniform_cost_search,
+    "bfs": bfs_path,
+}
+
+
+class SharedCSRGraph:
+    """A ``CSRGraph`` whose arrays live in ``multiprocessing.shared_memory``.
+
+    ``spec`` is a small picklable description that ``attach`` turns back
+    into a zero-copy ``CSRGraph`` in another process, labels included.  The
+    creating process owns the blocks and must ``close()`` them (or use
+    ``with``).
+    """
+
+    def __init__(self, graph):
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        self._blocks = []
+        arrays = {"indptr": graph.indptr, "indices": graph.indices}
+        if graph.weights is not None:
+            arrays["weights"] = graph.weights
+        fields = {}
+        for key, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self._blocks.append(block)
+            fields[key] = (block.name, array.dtype.str, array.shape)
+        self.spec = (fields, graph.directed, graph.labels)
+        self.graph = _view(self.spec, self._blocks)
+
+    @staticmethod
+    def attach(spec):
+        """Return ``(graph, blocks)`` mapped onto an existing spec; keep
+        ``blocks`` alive for as long as the graph is used."""
+        fields = spec[0]
+        blocks = [_open_block(name) for name, _, _ in fields.values()]
+        return _view(spec, blocks), blocks
+
+    def close(self):
+        self.graph = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BatchQueryEngine:
+    """Process pool whose workers share one graph through shared memory.
+
+    Keep the engine open to run many batches against the same graph.
+    Pairs and result paths use the graph's own node names: a labelled
+    graph (such as a dict keyed ``'A'``, ``'B'``, ...) is searched by id and
+    translated back here, so workers only ever see integer ids.
+    """
+
+    def __init__(self, graph, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.shared = SharedCSRGraph(graph)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.shared.spec,)
+        )
+
+    def query(self, pairs, method="ucs", chunksize=None):
+        """Answer every ``(start, goal)`` pair, returning results in input order.
+
+        ``method`` names a function in ``METHODS``; each result is what that
+        function returns for the pair (``(cost, path)`` or None).
+        """
+        if method not in METHODS:
+            raise ValueError(f"unknown method {method!r}, expected one of {sorted(METHODS)}")
+        graph = self.shared.graph
+        if graph.labels is None:
+            pairs = list(pairs)
+        else:
+            pairs = [(graph.id_of(start), graph.id_of(goal)) for start, goal in pairs]
+        if not pairs:
+            return []
+        if chunksize is None:
+            # a few chunks per worker keeps the load balanced without
+            # paying a round trip per query
+            chunksize = max(1, -(-len(pairs) // (self.workers * 4)))
+        chunks = [(method, pairs[i:i + chunksize]) for i in range(0, len(pairs), chunksize)]
+        results = []
+        for part in self._pool.map(_run_chunk, chunks):
+            results.extend(part)
+        if graph.labels is not None:
+            results = [None if result is None else (result[0], [graph.label_of(v) for v in result[1]])
+                       for result in results]
+        return results
+
+    def close(self):
+        self._pool.shutdown()
+        self.shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def batch_query(graph, pairs, method="ucs", workers=None, chunksize=None):
+    """One-off ``BatchQueryEngine`` run: answer ``pairs`` and clean up."""
+    with BatchQueryEngine(graph, workers) as engine:
+        return engine.query(pairs, method, chunksize)
+
+
+# worker side
+
+_worker_graph = None
+_worker_blocks = None
+
+
+def _init_worker(spec):
+    global _worker_graph, _worker_blocks
+    _worker_graph, _worker_blocks = SharedCSRGraph.attach(spec)
+
+
+def _run_chunk(task):
+    method, pairs = task
+    search = METHODS[method]
+    return [search(_worker_graph, start, goal) for start, goal in pairs]
+
+
+def _view(spec, blocks):
+    fields, directed, labels = spec
+    arrays = {}
+    for (key, (_, dtype, shape)), block in zip(fields.items(), blocks):
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return CSRGraph(arrays["indptr"], arrays["indices"], arrays.get("weights"), labels=labels,
+                    directed=directed)
+
+
+def _open_block(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 attaching always registers the block with the
+        # resource tracker; pool workers share the parent's tracker, so this
+        # is a harmless duplicate of the owner's registration
+        return shared_memory.SharedMemory(name=name)
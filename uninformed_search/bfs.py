@@ -0,0 +1,121 @@
+#breadth first search: a linear-time core plus the per-step snapshots the
+#animations use
+from collections import deque
+
+from .graph import neighbor_fn
+
+
+def bfs_steps(graph, start, goal=None, events=None):
+    """Run breadth first search, yielding ``(node, neighbors, queued)`` per expansion.
+
+    ``neighbors`` is the node's full neighbor list and ``queued`` the ones
+    that were discovered (and appended to the queue) by this expansion.  A
+    discovered set replaces scanning the queue, so the whole traversal is
+    O(V + E) and nothing is copied.  With a goal the search stops once the
+    goal is expanded.  ``events`` takes an ``events.EventLog``.
+    """
+    neighbors = neighbor_fn(graph)
+    discovered = {start}
+    queue = deque([start])
+    if events is not None:
+        events.push(start)
+    while queue:
+        node = queue.popleft()
+        adjacent = list(neighbors(node))
+        queued = []
+        for neighbor in adjacent:
+            if neighbor not in discovered:
+                discovered.add(neighbor)
+                queue.append(neighbor)
+                queued.append(neighbor)
+        if events is not None:
+            _record_expansion(events, node, adjacent, queued)
+        yield node, adjacent, queued
+        if goal is not None and node == goal:
+            if events is not None:
+                events.goal(node)
+            return
+
+
+def _record_expansion(events, node, adjacent, queued):
+    events.pop(node)
+    events.visit(node)
+    for neighbor in adjacent:
+        events.relax(node, neighbor)
+    for neighbor in queued:
+        events.push(neighbor)
+
+
+def bfs_tree(graph, start, goal=None, events=None):
+    """Return ``(order, parent)``: the expansion order and the BFS parent
+    of every discovered node (None for ``start``)."""
+    order = []
+    parent = {start: None}
+    for node, _, queued in bfs_steps(graph, start, goal, events):
+        order.append(node)
+        for neighbor in queued:
+            parent[neighbor] = node
+    return order, parent
+
+
+def bfs_states(graph, start, goal=None):
+    """Yield ``(visited, frontier, explored_edges)`` snapshots.
+
+    With a goal the search stops once the goal is expanded, otherwise the
+    whole component of ``start`` is traversed.  This is the animation layer
+    on top of ``bfs_steps``: every snapshot is a fresh copy, so only use it
+    when the intermediate states are actually wanted.
+    """
+    if goal is not None and start == goal:
+        yield {start}, [start], set()
+        return
+
+    visited = set()
+    queue = deque([start])
+    edge_states = set()
+    for node, adjacent, queued in bfs_steps(graph, start, goal):
+        yield visited.copy(), list(queue), edge_states.copy()
+
+        queue.popleft()
+        visited.add(node)
+        queue.extend(queued)
+        for neighbor in adjacent:
+            edge_states.add((min(node, neighbor), max(node, neighbor)))
+
+        # stop once the goal is actually reached
+        if goal is not None and node == goal:
+            yield visited.copy(), list(queue), edge_states.copy()
+            return
+
+        yield visited.copy(), list(queue), edge_states.copy()
+
+
+def bfs_path(graph, start, goal, events=None):
+    """Return ``(distance, path)`` of a fewest-edges start->goal path, or None."""
+    neighbors = neighbor_fn(graph)
+    parent = {start: None}
+    queue = deque([start])
+    if events is not None:
+        events.push(start)
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            if events is not None:
+                events.pop(node)
+                events.visit(node)
+                events.goal(node)
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.reverse()
+            return len(path) - 1, path
+        if events is not None:
+            _record_expansion(events, node, neighbors(node), ())
+        for neighbor in neighbors(node):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+                if events is not None:
+                    events.push(neighbor)
+    return None
@@ -0,0 +1,123 @@
+#bidirectional breadth first search on a numpy maze (0 = open, 1 = wall)
+
+import numpy as np
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+
+def is_valid_move(x, y, maze):
+    rows, cols = maze.shape
+    return 0 <= x < rows and 0 <= y < cols and maze[x, y] == 0
+
+
+def _expand_layer(free, shape, frontier, dist, parent, other_dist, events=None):
+    """Expand one full BFS layer and return ``(next_frontier, best_meet)``.
+
+    Only cells discovered in this layer can be new meeting points, so they
+    are the only ones checked against the other side.  The whole layer is
+    finished before choosing the meet with the smallest total length.
+    """
+    rows, cols = shape
+    next_frontier = []
+    best = None
+    best_length = None
+    for (x, y) in frontier:
+        if events is not None:
+            events.pop((x, y))
+            events.visit((x, y))
+        depth = dist[(x, y)] + 1
+        for dx, dy in DIRECTIONS:
+            nx_, ny_ = x + dx, y + dy
+            if 0 <= nx_ < rows and 0 <= ny_ < cols and free[nx_ * cols + ny_]:
+                cell = (nx_, ny_)
+                if cell in dist:
+                    continue
+                dist[cell] = depth
+                parent[cell] = (x, y)
+                next_frontier.append(cell)
+                if events is not None:
+                    events.relax((x, y), cell)
+                    events.push(cell)
+                other = other_dist.get(cell)
+                if other is not None and (best_length is None or depth + other < best_length):
+                    best = cell
+                    best_length = depth + other
+    return next_frontier, best
+
+
+def bidirectional_bfs(maze, start, goal, events=None):
+    """Search from both ends until the two searches meet.
+
+    Each round expands one full layer of whichever side has the smaller
+    frontier, so the meet point always lies on a shortest path.
+
+    Returns ``(meet_point, start_parent, goal_parent)``, or three Nones
+    when start/goal is blocked or no path exists.  ``events`` takes an
+    ``events.EventLog``; both sides record into it and the meet point is
+    recorded as the goal.
+    """
+    if maze[start] == 1 or maze[goal] == 1:
+        return None, None, None  # Start or goal is blocked
+
+    start_parent = {start: None}
+    goal_parent = {goal: None}
+
+    if start == goal:
+        if events is not None:
+            events.goal(start)
+        return start, start_parent, goal_parent
+
+    # one byte per cell is much cheaper to index from python than the array
+    free = (np.asarray(maze) == 0).tobytes()
+    shape = maze.shape
+
+    start_frontier = [start]
+    goal_frontier = [goal]
+    if events is not None:
+        events.push(start)
+        events.push(goal)
+
+    # distance of every visited cell from its own side
+    start_dist = {start: 0}
+    goal_dist = {goal: 0}
+
+    while start_frontier and goal_frontier:
+        if len(start_frontier) <= len(goal_frontier):
+            start_frontier, meet_point = _expand_layer(free, shape, start_frontier, start_dist, start_parent,
+                                                       goal_dist, events)
+        else:
+            goal_frontier, meet_point = _expand_layer(free, shape, goal_frontier, goal_dist, goal_parent,
+                                                      start_dist, events)
+        if meet_point is not None:
+            if events is not None:
+                events.goal(meet_point)
+            return meet_point, start_parent, goal_parent
+
+    return None, None, None  # No path found
+
+
+def reconstruct_path(came_from, current):
+    total_path = []
+    while current is not None:
+        total_path.append(current)
+        current = came_from.get(current)
+    return total_path[::-1]  # Return reversed path
+
+
+def join_paths(meet_point, start_parent, goal_parent):
+    """Stitch the two half-paths of a bidirectional search into one path."""
+    if meet_point is None:
+        return None
+    # Reconstruct path from start to intersection
+    path1 = reconstruct_path(start_parent, meet_point)
+    # Reconstruct path from goal to intersection (reverse, skip intersection)
+    path2 = reconstruct_path(goal_parent, meet_point)[::-1][1:]
+    return path1 + path2
+
+
+def bidirectional_path(maze, start, goal, events=None):
+    """Return ``(distance, path)`` from ``bidirectional_bfs``, or None."""
+    path = join_paths(*bidirectional_bfs(maze, start, goal, events))
+    if path is None:
+        return None
+    return len(path) - 1, path
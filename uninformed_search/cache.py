@@ -0,0 +1,222 @@
+#LRU cache of shortest path answers placed in front of a search function
+
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+
+
+class _Entry:
+    __slots__ = ("cost", "path", "prefix", "position", "nbytes")
+
+    def __init__(self, cost, path, prefix):
+        self.cost = cost
+        self.path = path
+        self.prefix = prefix  # prefix[i] = cost of path[:i + 1]
+        self.position = None if path is None else {node: i for i, node in enumerate(path)}
+        self.nbytes = _entry_size(self)
+
+
+class PathCache:
+    """Bounded LRU cache for ``search(graph, start, goal)`` answers.
+
+    ``search`` returns ``(cost, path)`` or None, like ``uniform_cost_search``,
+    ``bfs_path``, ``grid_bfs`` or ``bidirectional_path``.  For a NumPy
+    ``graph`` (a maze) or a plain ``{u: [v, ...]}`` adjacency every step
+    costs 1; otherwise step costs are read from the ``(neighbor, cost)``
+    pairs.
+
+    Entries are keyed on ``(version, start, goal)``.  Any sub-path of a
+    cached shortest path is itself a shortest path, so a query whose
+    endpoints appear in order on a cached path is answered from it.
+
+    When the graph changes, call ``edge_changed`` or ``cell_changed`` and only
+    entries the change could affect are dropped; ``bump_version`` drops
+    everything.  Eviction is least-recently-used once either ``max_entries``
+    or the estimated ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, search, graph, max_entries=1024, max_bytes=None, directed=True):
+        self.search = search
+        self.graph = graph
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directed = directed
+        self.version = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.subpath_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._by_node = {}   # node -> keys of entries whose path visits it
+        self._maze = isinstance(graph, np.ndarray)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def query(self, start, goal):
+        """Return the cached answer, computing and storing it on a miss."""
+        found, result = self.lookup(start, goal)
+        if found:
+            return result
+        version = self.version
+        result = self.search(self.graph, start, goal)
+        self.put(start, goal, result, version)
+        return result
+
+    def lookup(self, start, goal):
+        """Return ``(found, result)`` without running the search."""
+        key = (self.version, start, goal)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, None if entry.path is None else (entry.cost, list(entry.path))
+
+        for other in self._by_node.get(start, ()):
+            entry = self._entries[other]
+            i = entry.position[start]
+            j = entry.position.get(goal)
+            if j is not None and j >= i:
+                self._entries.move_to_end(other)
+                self.subpath_hits += 1
+                return True, (entry.prefix[j] - entry.prefix[i], entry.path[i:j + 1])
+
+        self.misses += 1
+        return False, None
+
+    def put(self, start, goal, result, version=None):
+        """Store a search result; results from an older version are ignored."""
+        if version is not None and version != self.version:
+            return
+        key = (self.version, start, goal)
+        if key in self._entries:
+            self._remove(key)
+        if result is None:
+            entry = _Entry(None, None, None)
+        else:
+            cost, path = result
+            entry = _Entry(cost, list(path), self._prefix_costs(path))
+        self._entries[key] = entry
+        self.nbytes += entry.nbytes
+        if entry.path is not None:
+            for node in entry.path:
+                self._by_node.setdefault(node, set()).add(key)
+        self._evict()
+
+    def edge_changed(self, u, v, new_cost=None, increased=True):
+        """Invalidate entries affected by a change to edge ``u -> v``.
+
+        A more expensive or removed edge (``increased``) only affects paths
+        that use it.  A cheaper or new edge of cost ``new_cost`` can only
+        shorten paths that cost more than ``new_cost``, and can connect
+        pairs cached as unreachable.
+        """
+        if increased:
+            doomed = [key for key in self._by_node.get(u, ()) if self._uses_edge(key, u, v)]
+        elif new_cost is None:
+            doomed = list(self._entries)
+        else:
+            doomed = [key for key, entry in self._entries.items()
+                      if entry.path is None or entry.cost > new_cost]
+        self._drop(doomed)
+
+    def cell_changed(self, cell, blocked):
+        """Invalidate entries affected by a maze cell becoming wall or open.
+
+        A new wall only breaks paths through it.  A newly opened cell can
+        only help a pair whose Manhattan distance via the cell is shorter
+        than the cached path, or a pair cached as unreachable.
+        """
+        if blocked:
+            doomed = list(self._by_node.get(cell, ()))
+        else:
+            doomed = []
+            for key, entry in self._entries.items():
+                if entry.path is None:
+                    doomed.append(key)
+                    continue
+                _, start, goal = key
+                detour = _manhattan(start, cell) + _manhattan(cell, goal)
+                if detour < entry.cost:
+                    doomed.append(key)
+        self._drop(doomed)
+
+    def bump_version(self):
+        """Start a new graph version and drop every cached entry."""
+        self.version += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_node.clear()
+        self.nbytes = 0
+
+    def clear(self):
+        self._entries.clear()
+        self._by_node.clear()
+        self.nbytes = 0
+
+    # internals
+
+    def _prefix_costs(self, path):
+        if self._maze:
+            return list(range(len(path)))
+        prefix = [0]
+        for u, v in zip(path, path[1:]):
+            prefix.append(prefix[-1] + _step_cost(self.graph[u], v))
+        return prefix
+
+    def _uses_edge(self, key, u, v):
+        position = self._entries[key].position
+        i, j = position[u], position.get(v)
+        if j is None:
+            return False
+        return j == i + 1 or (not self.directed and i == j + 1)
+
+    def _drop(self, keys):
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.nbytes -= entry.nbytes
+        if entry.path is not None:
+            for node in entry.path:
+                keys = self._by_node.get(node)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._by_node[node]
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+
+def _entry_size(entry):
+    # rough footprint: the containers plus one index-set slot per path node
+    size = sys.getsizeof(entry) + 64
+    if entry.path is not None:
+        size += sys.getsizeof(entry.path) + sys.getsizeof(entry.prefix) + sys.getsizeof(entry.position)
+        size += 8 * len(entry.path)
+    return size
+
+
+def _step_cost(adjacency, v):
+    # cheapest u -> v step in one adjacency list, which holds either plain
+    # neighbors (cost 1) or (neighbor, cost) pairs; a plain neighbor can be
+    # a tuple itself, such as a grid cell, so it is matched first
+    return min(1 if item == v else item[1] for item in adjacency
+               if item == v or (isinstance(item, tuple) and len(item) == 2 and item[0] == v))
+
+
+def _manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -0,0 +1,151 @@
+#depth limited search that returns the path to the goal
+
+
+class TranspositionTable:
+    """Prunes states revisited with no more remaining depth than before.
+
+    A search with a table never misses a goal within the limit, but may
+    report ``"failure"`` where the plain search reports ``"cutoff"``; past
+    ``max_entries`` states the oldest entry is evicted.
+    """
+
+    def __init__(self, max_entries=1_000_000):
+        self.max_entries = max_entries
+        self._entries = {}   # state -> (remaining depth, failed outright)
+        self.prunes = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, state):
+        """Return ``(remaining, failed)`` for a stored state, or None."""
+        return self._entries.get(state)
+
+    def store(self, state, remaining, failed):
+        entries = self._entries
+        # re-inserting moves the state to the young end
+        entries.pop(state, None)
+        entries[state] = (remaining, failed)
+        if len(entries) > self.max_entries:
+            del entries[next(iter(entries))]
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+
+def depth_limited_search_path(problem, limit, node=None, path=None, table=None, events=None):
+    """Return the path to a goal, ``"cutoff"`` or ``"failure"``.
+
+    Cycles are only avoided along the current path; pass a
+    ``TranspositionTable`` as ``table`` to also prune states that were
+    already explored with at least as much depth remaining.  With a table
+    the path found, and whether a miss says ``"cutoff"`` or ``"failure"``,
+    may differ from the plain search, but a goal within the limit is still
+    found.  ``events`` takes an ``events.EventLog``.
+    """
+    if node is None:
+        node = problem.initial
+    if path is None:
+        path = [node]
+    search = _search(problem, limit, path, table, events)
+    try:
+        return next(search)
+    except StopIteration as done:
+        return done.value
+
+
+def iter_depth_limited_solutions(problem, limit, node=None, path=None, events=None):
+    """Yield every goal path within ``limit``, in the order the search meets them.
+
+    The first one is what ``depth_limited_search_path`` returns.  The search
+    does not continue below a goal, and paths never repeat a state.
+    ``events`` takes an ``events.EventLog``.
+    """
+    if node is None:
+        node = problem.initial
+    if path is None:
+        path = [node]
+    yield from _search(problem, limit, path, None, events)
+
+
+def _search(problem, limit, path, table, events=None):
+    # depth first search with an explicit stack of child iterators instead
+    # of one Python frame per level, so the limit is not bounded by the
+    # recursion limit.  yields each goal path and finally returns "cutoff"
+    # or "failure".  results are (outcome, failed outright); a failure is
+    # only "outright" when it did not depend on which states happened to be
+    # on the path, and only those are trusted when the table prunes
+    path = list(path)
+    on_path = set(path)
+    root_depth = len(path)
+    stack = []   # [children, remaining, cutoff occurred, failed outright]
+    node = path[-1]
+    remaining = limit
+    if events is not None:
+        events.push(node)
+    while True:
+        # visit the node at the end of the path
+        result = None
+        if events is not None:
+            events.pop(node)
+            events.visit(node)
+        if problem.is_goal(node):
+            if events is not None:
+                events.goal(node)
+            yield list(path)
+            result = ("goal", False)
+        elif remaining == 0:
+            result = ("cutoff", False)
+        else:
+            seen = table.lookup(node) if table is not None else None
+            # with no more depth left than last time this subtree cannot
+            # find anything new.  it only reports "failure" if the earlier
+            # visit failed outright, without hitting the limit or skipping a
+            # state that was on the path then; otherwise "cutoff", since the
+            # goal may still lie beyond a state blocked only by that path
+            if seen is not None and seen[0] >= remaining:
+                table.prunes += 1
+                result = ("failure", True) if seen[1] else ("cutoff", False)
+            else:
+                if table is not None:
+                    # while the subtree is open it counts as not failed
+                    table.store(node, remaining, False)
+                stack.append([iter(problem.expand(node)), remaining, False, True])
+
+        # hand finished results up the stack until there is a child to visit
+        while True:
+            if result is not None:
+                if len(path) == root_depth:
+                    return "cutoff" if result[0] == "cutoff" else "failure"
+                on_path.discard(path.pop())
+                frame = stack[-1]
+                if result[0] != "failure":
+                    frame[3] = False
+                    if result[0] == "cutoff":
+                        frame[2] = True
+                elif not result[1]:
+                    frame[3] = False
+                result = None
+            frame = stack[-1]
+            for child in frame[0]:
+                if child not in on_path:  # avoid cycles
+                    break
+                frame[3] = False
+            else:
+                # every child is done
+                stack.pop()
+                outright = frame[3] and not frame[2]
+                if table is not None:
+                    table.store(path[-1], frame[1], outright)
+                result = ("cutoff" if frame[2] else "failure", outright)
+                continue
+            if events is not None:
+                events.relax(path[-1], child)
+                events.push(child)
+            path.append(child)
+            on_path.add(child)
+            node = child
+            remaining = frame[1] - 1
+            break
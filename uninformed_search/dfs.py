@@ -0,0 +1,52 @@
+#depth first search helpers
+
+from .graph import neighbor_fn
+
+
+def dfs_with_trace(graph, start, events=None):
+    """Iterative DFS yielding ``(node, order, stack, visited)`` per step.
+
+    The yielded objects are the live ones and change as the search goes on;
+    pass an ``events.EventLog`` as ``events`` for a trace that can be
+    replayed afterwards.
+    """
+    neighbors = neighbor_fn(graph)
+    visited = set()
+    stack = [start]
+    order = []
+    if events is not None:
+        events.push(start)
+
+    while stack:
+        node = stack.pop()
+        if events is not None:
+            events.pop(node)
+
+        if node not in visited:
+            visited.add(node)
+            order.append(node)
+            if events is not None:
+                events.visit(node)
+
+        for n in reversed(neighbors(node)):
+            if events is not None:
+                events.relax(node, n)
+            if n not in visited:
+                stack.append(n)
+                if events is not None:
+                    events.push(n)
+
+        yield node, order, stack, visited
+
+
+def dfs_recursive(graph, start, visited=None):
+    if visited is None:
+        visited = set()
+
+    visited.add(start)
+
+    for neighbour in neighbor_fn(graph)(start):
+        if neighbour not in visited:
+            dfs_recursive(graph, neighbour, visited)
+
+    return visited
@@ -0,0 +1,167 @@
+#single-source shortest paths that are repaired, not recomputed, when edge
+#costs change: lifelong planning A* (LPA*) with a zero heuristic, which is
+#the incremental form of uniform cost search
+
+import heapq
+
+from .graph import weighted_neighbor_fn
+
+INF = float("inf")
+
+
+class DynamicShortestPaths:
+    """Shortest path tree from ``source`` kept up to date under edge updates.
+
+    Every node has ``g`` (its current cost) and ``rhs`` (the best cost one
+    step from its predecessors' ``g``).  An edge change only re-evaluates the
+    ``rhs`` of the edge's head; nodes whose two values then disagree go on a
+    priority queue and are repaired the next time a cost or path is asked
+    for, so work is proportional to the part of the tree that changed.
+
+    ``graph`` is a weighted adjacency dict or a ``CSRGraph`` (an unweighted
+    one costs 1 per edge) and is copied; all updates go through this
+    object.  With ``directed=False`` every update applies to both
+    directions of the edge.  Edge costs must be positive: around a
+    zero-cost cycle stale costs would vouch for each other.  Self-loops
+    are never on a shortest path and are ignored.
+    """
+
+    def __init__(self, graph, source, directed=True):
+        edges_of = weighted_neighbor_fn(graph)
+        self.source = source
+        self.directed = directed
+        self.expansions = 0
+        self._succ = {}
+        self._pred = {}
+        for u in graph:
+            self._succ.setdefault(u, {})
+            self._pred.setdefault(u, {})
+            for v, cost in edges_of(u):
+                self._set(u, v, cost, keep_cheaper=True)
+        self._succ.setdefault(source, {})
+        self._pred.setdefault(source, {})
+
+        self._g = {}
+        self._rhs = {source: 0}
+        self._heap = [(0, source)]
+        self._open = {source: 0}   # node -> key of its live heap entry
+
+    #graph updates
+
+    def update_edge(self, u, v, cost):
+        """Change the cost of an existing edge ``u -> v``."""
+        if v not in self._succ.get(u, {}):
+            raise KeyError((u, v))
+        self._change(u, v, cost)
+
+    def add_edge(self, u, v, cost):
+        """Add edge ``u -> v`` (or overwrite its cost)."""
+        self._change(u, v, cost)
+
+    def remove_edge(self, u, v):
+        if v not in self._succ.get(u, {}):
+            raise KeyError((u, v))
+        self._change(u, v, None)
+
+    #queries
+
+    def cost_to(self, node):
+        """Cost of the cheapest source->node path, or None if unreachable."""
+        self._compute(node)
+        cost = self._g.get(node, INF)
+        return None if cost == INF else cost
+
+    def path_to(self, node):
+        """Cheapest source->node path, or None if unreachable."""
+        if self.cost_to(node) is None:
+            return None
+        # walk back through the predecessor that explains each cost; parent
+        # pointers can be stale for nodes the lazy repair has not reached yet
+        g = self._g
+        path = [node]
+        while node != self.source:
+            node = min((item for item in self._pred[node].items() if item[0] != node),
+                       key=lambda item: g.get(item[0], INF) + item[1])[0]
+            path.append(node)
+        path.reverse()
+        return path
+
+    def settle_all(self):
+        """Repair every pending node so all costs are final."""
+        self._compute(None)
+
+    #internals
+
+    def _set(self, u, v, cost, keep_cheaper=False):
+        if cost is not None and not cost > 0:
+            raise ValueError(f"edge costs must be positive, got {cost!r} for {(u, v)!r}")
+        for a, b in ((u, v),) if self.directed else ((u, v), (v, u)):
+            succ = self._succ.setdefault(a, {})
+            pred = self._pred.setdefault(b, {})
+            self._succ.setdefault(b, {})
+            self._pred.setdefault(a, {})
+            if cost is None:
+                del succ[b]
+                del pred[a]
+            else:
+                if keep_cheaper and b in succ:
+                    # parallel edges collapse to the cheapest one
+                    cost = min(cost, succ[b])
+                succ[b] = cost
+                pred[a] = cost
+
+    def _change(self, u, v, cost):
+        self._set(u, v, cost)
+        self._update_vertex(v)
+        if not self.directed:
+            self._update_vertex(u)
+
+    def _key(self, node):
+        return min(self._g.get(node, INF), self._rhs.get(node, INF))
+
+    def _update_vertex(self, node):
+        if node != self.source:
+            best = INF
+            g = self._g
+            for p, cost in self._pred.get(node, {}).items():
+                total = g.get(p, INF) + cost
+                if total < best and p != node:
+                    best = total
+            self._rhs[node] = best
+        if self._g.get(node, INF) != self._rhs.get(node, INF):
+            key = self._key(node)
+            if self._open.get(node) != key:
+                self._open[node] = key
+                heapq.heappush(self._heap, (key, node))
+        else:
+            self._open.pop(node, None)
+
+    def _top(self):
+        heap = self._heap
+        while heap and self._open.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)  # stale entry
+        return heap[0][0] if heap else INF
+
+    def _compute(self, goal):
+        g, rhs = self._g, self._rhs
+        while self._heap:
+            top = self._top()
+            if top == INF:
+                break
+            if goal is not None and top >= self._key(goal) and g.get(goal, INF) == rhs.get(goal, INF):
+                break
+            _, node = heapq.heappop(self._heap)
+            del self._open[node]
+            self.expansions += 1
+            if g.get(node, INF) > rhs.get(node, INF):
+                # overconsistent: the node got cheaper, settle it
+                g[node] = rhs[node]
+                for succ in self._succ.get(node, {}):
+                    self._update_vertex(succ)
+            else:
+                # underconsistent: the node got dearer, re-derive it and
+                # everything that was hanging off it
+                g[node] = INF
+                self._update_vertex(node)
+                for succ in self._succ.get(node, {}):
+                    self._update_vertex(succ)
@@ -0,0 +1,232 @@
+#compact search traces: the searches report push / pop / visit / relax /
+#goal events to an EventLog, which stores them in typed arrays, and Replay
+#rebuilds the visited set, frontier and explored edges at any frame from
+#periodic keyframes instead of keeping a full copy of the state per step
+
+import json
+from array import array
+
+import numpy as np
+
+PUSH, POP, VISIT, RELAX, GOAL = range(5)
+KINDS = ("push", "pop", "visit", "relax", "goal")
+
+
+class EventLog:
+    """Append-only event stream of one search.
+
+    Pass it as ``events=`` to ``bfs_steps``, ``bfs_tree``, ``bfs_path``,
+    ``grid_bfs``, ``bidirectional_bfs``, ``bidirectional_path``,
+    ``uniform_cost_search``, ``bidirectional_ucs``, ``shortest_path_tree``,
+    ``dfs_with_trace``, ``depth_limited_search``,
+    ``depth_limited_search_path``, ``iter_depth_limited_solutions`` or
+    ``iterative_deepening_search``.  Nodes can
+    be any hashable; each one is stored once in ``labels`` and the events
+    refer to it by index, so a step costs a few bytes instead of a copy of
+    the search state.  The ``u``/``v``/``cost`` of ``relax`` events (an
+    edge being examined) live in their own arrays, in event order.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.nodes = array("q")     # the node of every event, u for relax
+        self.targets = array("q")   # v of each relax event
+        self.costs = array("d")     # cost of each relax event
+        self.labels = []
+        self._ids = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _id(self, node):
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = self._ids[node] = len(self.labels)
+            self.labels.append(node)
+        return node_id
+
+    #recording
+
+    def push(self, node):
+        self.kinds.append(PUSH)
+        self.nodes.append(self._id(node))
+
+    def pop(self, node):
+        self.kinds.append(POP)
+        self.nodes.append(self._id(node))
+
+    def visit(self, node):
+        self.kinds.append(VISIT)
+        self.nodes.append(self._id(node))
+
+    def relax(self, u, v, cost=1):
+        self.kinds.append(RELAX)
+        self.nodes.append(self._id(u))
+        self.targets.append(self._id(v))
+        self.costs.append(cost)
+
+    def goal(self, node):
+        self.kinds.append(GOAL)
+        self.nodes.append(self._id(node))
+
+    #reading
+
+    def __iter__(self):
+        """Yield ``(kind, node)``, or ``("relax", u, v, cost)``, per event."""
+        labels = self.labels
+        relaxed = 0
+        for kind, node in zip(self.kinds, self.nodes):
+            if kind == RELAX:
+                yield ("relax", labels[node], labels[self.targets[relaxed]], self.costs[relaxed])
+                relaxed += 1
+            else:
+                yield KINDS[kind], labels[node]
+
+    def write_jsonl(self, path):
+        """Write one JSON object per event."""
+        with open(path, "w") as f:
+            for event in self:
+                if event[0] == "relax":
+                    record = {"event": "relax", "u": event[1], "v": event[2], "cost": event[3]}
+                else:
+                    record = {"event": event[0], "node": event[1]}
+                f.write(json.dumps(record) + "\n")
+
+    @classmethod
+    def read_jsonl(cls, path):
+        log = cls()
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if record["event"] == "relax":
+                    log.relax(_from_json(record["u"]), _from_json(record["v"]), record["cost"])
+                else:
+                    getattr(log, record["event"])(_from_json(record["node"]))
+        return log
+
+    def write_binary(self, path):
+        """Write the raw arrays to an ``.npz`` file (labels as JSON)."""
+        np.savez_compressed(
+            path,
+            kinds=np.frombuffer(self.kinds, dtype=np.uint8),
+            nodes=np.frombuffer(self.nodes, dtype=np.int64),
+            targets=np.frombuffer(self.targets, dtype=np.int64),
+            costs=np.frombuffer(self.costs, dtype=np.float64),
+            labels=np.array(json.dumps(self.labels)),
+        )
+
+    @classmethod
+    def read_binary(cls, path):
+        log = cls()
+        with np.load(path) as data:
+            log.kinds.frombytes(data["kinds"].astype(np.uint8).tobytes())
+            log.nodes.frombytes(data["nodes"].astype(np.int64).tobytes())
+            log.targets.frombytes(data["targets"].astype(np.int64).tobytes())
+            log.costs.frombytes(data["costs"].astype(np.float64).tobytes())
+            log.labels = [_from_json(label) for label in json.loads(str(data["labels"]))]
+        log._ids = {label: i for i, label in enumerate(log.labels)}
+        return log
+
+
+class SearchState:
+    """The search as it stood after some number of events."""
+
+    def __init__(self, visited, frontier, edges, goal):
+        self.visited = visited     # set of nodes
+        self.frontier = frontier   # list of queued nodes, oldest first
+        self.edges = edges         # set of examined (u, v) edges
+        self.goal = goal           # the goal node once reached, else None
+
+    def __repr__(self):
+        return (f"SearchState(visited={len(self.visited)}, frontier={len(self.frontier)}, "
+                f"edges={len(self.edges)}, goal={self.goal!r})")
+
+
+class Replay:
+    """Random access to the states of an ``EventLog``.
+
+    A keyframe of the state is stored every ``keyframe_every`` events, so
+    ``state_at(frame)`` replays at most that many events from the nearest
+    one.  Frame 0 is the empty state and frame ``len(log)`` the final one.
+    """
+
+    def __init__(self, log, keyframe_every=1024):
+        self.log = log
+        self.keyframe_every = keyframe_every
+        self._keyframes = []
+        state = _State()
+        for frame in range(0, len(log) + 1, keyframe_every):
+            if frame:
+                state.apply(log, frame - keyframe_every, frame)
+            self._keyframes.append(state.copy())
+
+    def __len__(self):
+        return len(self.log) + 1
+
+    def state_at(self, frame):
+        if not 0 <= frame <= len(self.log):
+            raise IndexError(frame)
+        start = frame // self.keyframe_every * self.keyframe_every
+        state = self._keyframes[frame // self.keyframe_every].copy()
+        state.apply(self.log, start, frame)
+        labels = self.log.labels
+        return SearchState(
+            {labels[i] for i in state.visited},
+            [labels[i] for i, count in state.frontier.items() for _ in range(count)],
+            {(labels[u], labels[v]) for u, v in state.edges},
+            None if state.goal is None else labels[state.goal],
+        )
+
+    def __iter__(self):
+        for frame in range(len(self)):
+            yield self.state_at(frame)
+
+
+class _State:
+    # replay state in node ids; the frontier is an insertion-ordered
+    # multiset so popping a node is O(1) whether it was queued or stacked
+
+    def __init__(self):
+        self.visited = set()
+        self.frontier = {}
+        self.edges = set()
+        self.goal = None
+        self.relaxed = 0   # relax events consumed so far
+
+    def copy(self):
+        state = _State()
+        state.visited = set(self.visited)
+        state.frontier = dict(self.frontier)
+        state.edges = set(self.edges)
+        state.goal = self.goal
+        state.relaxed = self.relaxed
+        return state
+
+    def apply(self, log, start, stop):
+        kinds, nodes = log.kinds, log.nodes
+        frontier = self.frontier
+        for i in range(start, stop):
+            kind = kinds[i]
+            node = nodes[i]
+            if kind == PUSH:
+                frontier[node] = frontier.get(node, 0) + 1
+            elif kind == POP:
+                count = frontier.get(node, 0)
+                if count > 1:
+                    frontier[node] = count - 1
+                elif count:
+                    del frontier[node]
+            elif kind == VISIT:
+                self.visited.add(node)
+            elif kind == RELAX:
+                self.edges.add((node, log.targets[self.relaxed]))
+                self.relaxed += 1
+            else:
+                self.goal = node
+
+
+def _from_json(value):
+    # JSON turns tuple nodes such as grid cells into lists
+    if isinstance(value, list):
+        return tuple(_from_json(item) for item in value)
+    return value
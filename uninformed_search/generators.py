@@ -0,0 +1,92 @@
+#random graphs and mazes for the demos and load tests
+import random
+
+import numpy as np
+
+from .graph import CSRGraph
+
+
+def gen_graph(n, p, seed=None):
+    """Undirected G(n, p) graph as an adjacency dict of neighbor lists.
+
+    Tries every pair, so it is only meant for small demo graphs; use
+    ``gnp_csr`` for large ones.
+    """
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(n)}
+    for i in range(n):
+        for j in range(i+1, n):
+            if rng.random() < p:
+                graph[i].append(j)
+                graph[j].append(i)
+    return graph
+
+
+def gnp_edges(n, p, seed=None):
+    """Edges ``(sources, targets)`` of an undirected G(n, p) graph, each once.
+
+    Uses Batagelj and Brandes' geometric skipping: the gaps between chosen
+    pairs of the ``n(n-1)/2`` candidates are geometric, so they are drawn
+    directly (in NumPy batches) and the work is proportional to the number
+    of edges rather than n².  ``seed`` goes to ``numpy.random.default_rng``.
+    Every edge has ``source > target``.
+    """
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    if p <= 0 or total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty.copy()
+    if p >= 1:
+        picks = np.arange(total, dtype=np.int64)
+    else:
+        chunks = []
+        last = -1
+        # a little more than the expected count per batch, in bounded memory
+        batch = min(int(total * p * 1.05) + 64, 1 << 22)
+        while last < total:
+            gaps = rng.geometric(p, size=batch)
+            positions = last + np.cumsum(gaps)
+            chunks.append(positions[positions < total])
+            last = int(positions[-1])
+        picks = np.concatenate(chunks)
+    # pair number k is (v, w) with w < v and k = v(v-1)/2 + w
+    v = ((1 + np.sqrt(1 + 8 * picks.astype(np.float64))) // 2).astype(np.int64)
+    # the float square root can be one off for very large k
+    v -= v * (v - 1) // 2 > picks
+    v += (v + 1) * v // 2 <= picks
+    w = picks - v * (v - 1) // 2
+    return v, w
+
+
+def gnp_csr(n, p, seed=None):
+    """Undirected G(n, p) graph as a ``CSRGraph``, built straight from the
+    ``gnp_edges`` arrays."""
+    sources, targets = gnp_edges(n, p, seed)
+    return CSRGraph.from_edges(n, sources, targets, directed=False)
+
+
+def random_weighted_graph(n, p, max_weight=10, seed=None):
+    """Undirected G(n, p) ``CSRGraph`` for uniform cost search, with integer
+    edge costs drawn uniformly from ``1..max_weight`` (both directions of an
+    edge cost the same)."""
+    rng = np.random.default_rng(seed)
+    sources, targets = gnp_edges(n, p, rng)
+    weights = rng.integers(1, max_weight + 1, size=len(sources))
+    return CSRGraph.from_edges(n, sources, targets, weights, directed=False)
+
+
+def random_maze(rows, cols, wall_density=0.3, seed=None, start=(0, 0), goal=None):
+    """Grid of 0 (open) and 1 (wall) cells for the grid searches.
+
+    Each cell is a wall with probability ``wall_density``; ``start`` and
+    ``goal`` (default: the bottom-right corner) are always left open.  The
+    goal is not guaranteed to be reachable.
+    """
+    rng = np.random.default_rng(seed)
+    maze = (rng.random((rows, cols)) < wall_density).astype(np.int8)
+    if goal is None:
+        goal = (rows - 1, cols - 1)
+    for cell in (start, goal):
+        if cell is not None:
+            maze[cell] = 0
+    return maze
@@ -0,0 +1,302 @@
+#compressed sparse row (CSR) graph storage
+#the neighbors of node u are indices[indptr[u]:indptr[u+1]] and the matching
+#edge costs are weights[indptr[u]:indptr[u+1]], node ids are 0..n-1
+
+import numpy as np
+
+
+class CSRGraph:
+    """Static graph stored as three flat NumPy arrays.
+
+    Indexing with ``graph[u]`` gives the same shape as the adjacency dicts
+    used by the scripts: a list of ``(neighbor, cost)`` tuples for weighted
+    graphs and a plain neighbor list otherwise, so a ``CSRGraph`` can be
+    passed anywhere a dict graph is accepted.  Nodes are always the ids
+    ``0..n-1``: ``labels`` keeps the original node names when the graph was
+    built from labelled data, and callers searching such a graph pass
+    ``id_of(name)`` and map the resulting path back with ``label_of``.
+    """
+
+    def __init__(self, indptr, indices, weights=None, labels=None, directed=True):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices)
+        if self.indices.dtype.kind not in "iu":
+            self.indices = self.indices.astype(np.int64)
+        self.weights = None if weights is None else np.asarray(weights)
+        self.labels = None if labels is None else list(labels)
+        self.directed = directed
+        self._ids = None
+        self._weight_bound = _UNKNOWN
+        self._reverse = None
+
+        if self.indptr.ndim != 1 or len(self.indptr) == 0:
+            raise ValueError("indptr must be a non-empty 1-d array")
+        if self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr[-1] must equal the number of edges")
+        if self.weights is not None and len(self.weights) != len(self.indices):
+            raise ValueError("weights and indices must have the same length")
+        if self.labels is not None and len(self.labels) != self.num_nodes:
+            raise ValueError("need exactly one label per node")
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    #construction
+
+    @classmethod
+    def from_edges(cls, num_nodes, sources, targets, weights=None, directed=True, labels=None):
+        """Build from parallel edge arrays; undirected edges are stored both ways."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights)
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+
+        # stable sort keeps the original neighbor order of every node
+        order = np.argsort(sources, kind="stable")
+        counts = np.bincount(sources, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = targets[order].astype(_index_dtype(num_nodes))
+        if weights is not None:
+            weights = weights[order]
+        return cls(indptr, indices, weights, labels=labels, directed=directed)
+
+    @classmethod
+    def from_dict(cls, graph, directed=True, weighted=None):
+        """Build from ``{u: [v, ...]}`` or ``{u: [(v, cost), ...]}``.
+
+        Integer graphs keyed ``0..n-1`` keep their ids; any other labels are
+        numbered in first-seen order and kept in ``labels``.  ``weighted``
+        says which of the two formats ``graph`` uses; by default it is read
+        from the items, so tuple nodes such as grid cells stay neighbors, and
+        a ValueError asks for it when the items fit both formats.
+        """
+        if weighted is None:
+            weighted = _is_weighted(graph)
+
+        labels = list(graph)
+        ids = {label: i for i, label in enumerate(labels)}
+        for nbrs in graph.values():
+            for item in nbrs:
+                v = item[0] if weighted else item
+                if v not in ids:
+                    ids[v] = len(labels)
+                    labels.append(v)
+
+        sources, targets, weights = [], [], []
+        for u, nbrs in graph.items():
+            iu = ids[u]
+            for item in nbrs:
+                sources.append(iu)
+                if weighted:
+                    targets.append(ids[item[0]])
+                    weights.append(item[1])
+                else:
+                    targets.append(ids[item])
+
+        if labels == list(range(len(labels))):
+            labels = None
+        if weighted:
+            weights = np.array(weights, dtype=np.int64 if all(_is_int(w) for w in weights) else np.float64)
+        else:
+            weights = None
+        # dict graphs already list both directions of undirected edges
+        csr = cls.from_edges(len(ids), sources, targets, weights, directed=True, labels=labels)
+        csr.directed = directed
+        return csr
+
+    @classmethod
+    def from_networkx(cls, G, weight="weight"):
+        """Build from a networkx (Di)Graph, reading costs from ``weight``."""
+        labels = list(G.nodes())
+        ids = {label: i for i, label in enumerate(labels)}
+        sources, targets, values = [], [], []
+        # G.adjacency() lists undirected edges from both ends already
+        for u, nbrs in G.adjacency():
+            for v, data in nbrs.items():
+                sources.append(ids[u])
+                targets.append(ids[v])
+                values.append(data.get(weight) if weight is not None else None)
+        weights = None
+        if values and all(w is not None for w in values):
+            weights = np.array(values, dtype=np.int64 if all(_is_int(w) for w in values) else np.float64)
+        if labels == list(range(len(labels))):
+            labels = None
+        csr = cls.from_edges(len(ids), sources, targets, weights, directed=True, labels=labels)
+        csr.directed = G.is_directed()
+        return csr
+
+    #conversion
+
+    def to_dict(self, use_labels=True):
+        """Return the adjacency dict format used by the scripts."""
+        name = self.label_of if (use_labels and self.labels is not None) else (lambda i: i)
+        indices = self.indices.tolist()
+        indptr = self.indptr.tolist()
+        weights = None if self.weights is None else self.weights.tolist()
+        graph = {}
+        for u in range(self.num_nodes):
+            a, b = indptr[u], indptr[u + 1]
+            if weights is None:
+                graph[name(u)] = [name(v) for v in indices[a:b]]
+            else:
+                graph[name(u)] = [(name(v), w) for v, w in zip(indices[a:b], weights[a:b])]
+        return graph
+
+    def to_networkx(self, use_labels=True):
+        """Return a networkx graph with costs in the ``weight`` attribute."""
+        import networkx as nx
+
+        G = nx.DiGraph() if self.directed else nx.Graph()
+        name = self.label_of if (use_labels and self.labels is not None) else (lambda i: i)
+        G.add_nodes_from(name(u) for u in range(self.num_nodes))
+        sources = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr)).tolist()
+        targets = self.indices.tolist()
+        if self.weights is None:
+            G.add_edges_from((name(u), name(v)) for u, v in zip(sources, targets))
+        else:
+            G.add_weighted_edges_from(
+                (name(u), name(v), w) for u, v, w in zip(sources, targets, self.weights.tolist())
+            )
+        return G
+
+    #labels
+
+    def id_of(self, label):
+        if self.labels is None:
+            return label
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self.labels)}
+        return self._ids[label]
+
+    def label_of(self, node):
+        return node if self.labels is None else self.labels[node]
+
+    #adjacency access
+
+    def neighbors(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]].tolist()
+
+    def edges(self, u):
+        """``(neighbor, cost)`` pairs of ``u``; unweighted edges cost 1."""
+        a, b = self.indptr[u], self.indptr[u + 1]
+        if self.weights is None:
+            return [(v, 1) for v in self.indices[a:b].tolist()]
+        return list(zip(self.indices[a:b].tolist(), self.weights[a:b].tolist()))
+
+    def degree(self, u):
+        return int(self.indptr[u + 1] - self.indptr[u])
+
+    def __getitem__(self, u):
+        if not 0 <= u < self.num_nodes:
+            raise KeyError(u)
+        return self.edges(u) if self.weights is not None else self.neighbors(u)
+
+    def get(self, u, default=None):
+        try:
+            return self[u]
+        except (KeyError, TypeError):
+            return default
+
+    def __contains__(self, u):
+        return isinstance(u, (int, np.integer)) and 0 <= u < self.num_nodes
+
+    def __iter__(self):
+        return iter(range(self.num_nodes))
+
+    def keys(self):
+        return range(self.num_nodes)
+
+    def items(self):
+        return ((u, self[u]) for u in range(self.num_nodes))
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __repr__(self):
+        kind = "weighted" if self.weighted else "unweighted"
+        return f"CSRGraph({self.num_nodes} nodes, {self.num_edges} edges, {kind})"
+
+
+def neighbor_fn(graph):
+    """Return ``u -> list of neighbors`` for a dict or CSR graph."""
+    if isinstance(graph, CSRGraph):
+        return graph.neighbors
+    return graph.__getitem__
+
+
+def weighted_neighbor_fn(graph):
+    """Return ``u -> list of (neighbor, cost)`` for a dict or CSR graph."""
+    if isinstance(graph, CSRGraph):
+        return graph.edges
+    return graph.__getitem__
+
+
+def integer_weight_bound(graph):
+    """Largest edge cost if every cost is a non-negative integer, else None.
+
+    Unweighted CSR graphs count as cost 1 everywhere.  The answer for a CSR
+    graph is computed once and cached on it; dict graphs are scanned.
+    """
+    if isinstance(graph, CSRGraph):
+        if graph._weight_bound is _UNKNOWN:
+            weights = graph.weights
+            if weights is None:
+                graph._weight_bound = 1 if graph.num_edges else 0
+            elif weights.dtype.kind in "iu" and (not len(weights) or weights.min() >= 0):
+                graph._weight_bound = int(weights.max()) if len(weights) else 0
+            else:
+                graph._weight_bound = None
+        return graph._weight_bound
+
+    bound = 0
+    for edges in graph.values():
+        for _, cost in edges:
+            if not _is_int(cost) or cost < 0:
+                return None
+            if cost > bound:
+                bound = cost
+    return int(bound)
+
+
+_UNKNOWN = object()
+
+
+def _is_weighted(graph):
+    # an item that is a key of the graph is a neighbor; a (neighbor, cost)
+    # pair is a 2-tuple with a numeric cost that is not itself a key
+    items = [item for nbrs in graph.values() for item in nbrs]
+    nodes = [item in graph for item in items]
+    if all(nodes):
+        return False
+    pairs = [isinstance(item, tuple) and len(item) == 2 and _is_number(item[1]) for item in items]
+    if not any(pairs):
+        return False
+    if all(pairs) and not any(nodes):
+        return True
+    raise ValueError("cannot tell (neighbor, cost) pairs from tuple nodes; pass weighted=True or False")
+
+
+def _index_dtype(num_nodes):
+    return np.int32 if num_nodes < 2**31 else np.int64
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def _is_int(value):
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
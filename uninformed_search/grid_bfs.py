@@ -0,0 +1,124 @@
+#level-synchronous breadth first search on a numpy maze (0 = open, 1 = wall)
+#the whole frontier is expanded at once with array operations instead of
+#popping one cell at a time
+
+import numpy as np
+
+
+def grid_bfs(maze, start, goal, events=None):
+    """Return ``(distance, path)`` of a shortest start->goal path, or None.
+
+    Cells are stored as flat indices into a copy of the maze padded with a
+    wall border, so the four moves are plain offsets with no bounds checks.
+    Each level keeps its cells in discovery order and the first parent to
+    reach a cell wins, which gives exactly the parents of a one-cell-at-a-time
+    BFS with the up, down, left, right move order of ``bidirectional_bfs``.
+    ``events`` takes an ``events.EventLog``.
+    """
+    maze = np.asarray(maze)
+    if maze[start] != 0 or maze[goal] != 0:
+        return None  # Start or goal is blocked
+
+    parent, found = grid_bfs_parents(maze, start, goal, events)
+    if not found:
+        return None
+
+    rows, cols = maze.shape
+    width = cols + 2
+    source = _flat(start, width)
+    current = _flat(goal, width)
+    path = [goal]
+    while current != source:
+        current = int(parent[current])
+        r, c = divmod(current, width)
+        path.append((r - 1, c - 1))
+    path.reverse()
+    return len(path) - 1, path
+
+
+def grid_bfs_parents(maze, start, goal=None, events=None):
+    """Run the frontier-at-a-time BFS and return ``(parent, goal_found)``.
+
+    ``parent`` is an int32 array over the padded flat indices (-1 where a
+    cell was never reached); the search stops early once ``goal`` is seen.
+    With an ``events.EventLog`` every level is replayed cell by cell, in
+    the order a one-cell-at-a-time BFS would record it.
+    """
+    maze = np.asarray(maze)
+    rows, cols = maze.shape
+    width = cols + 2
+
+    free = np.zeros((rows + 2, width), dtype=bool)
+    free[1:-1, 1:-1] = maze == 0
+    # walls and the border count as already seen so they are never queued
+    seen = ~free.ravel()
+    parent = np.full(seen.size, -1, dtype=np.int32)
+    # position of the first candidate that claimed each cell this level
+    unclaimed = np.iinfo(np.int64).max
+    claim = np.full(seen.size, unclaimed, dtype=np.int64)
+
+    offsets = np.array([-width, width, -1, 1], dtype=np.int64)  # Up, Down, Left, Right
+    source = _flat(start, width)
+    target = None if goal is None else _flat(goal, width)
+    seen[source] = True
+    frontier = np.array([source], dtype=np.int64)
+    if events is not None:
+        events.push(tuple(start))
+
+    while frontier.size:
+        if target is not None and seen[target]:
+            if events is not None:
+                # a one-cell-at-a-time BFS pops the goal's level up to the goal
+                for node in frontier.tolist():
+                    events.pop(_cell(node, width))
+                    events.visit(_cell(node, width))
+                    if node == target:
+                        break
+                events.goal(tuple(goal))
+            break
+        candidates = (frontier[:, None] + offsets).ravel()
+        sources = np.repeat(frontier, len(offsets))
+        fresh = ~seen[candidates]
+        candidates = candidates[fresh]
+        sources = sources[fresh]
+        if not candidates.size:
+            if events is not None:
+                _record_level(events, frontier, candidates, sources, width)
+            break
+        # keep the first discovery of each cell, in discovery order
+        order = np.arange(candidates.size, dtype=np.int64)
+        np.minimum.at(claim, candidates, order)
+        first = claim[candidates] == order
+        claim[candidates] = unclaimed
+        if events is not None:
+            _record_level(events, frontier, candidates[first], sources[first], width)
+        frontier = candidates[first]
+        parent[frontier] = sources[first]
+        seen[frontier] = True
+
+    return parent, target is not None and bool(seen[target])
+
+
+def _record_level(events, frontier, cells, sources, width):
+    # discovery order groups the new cells by their parent's place in the
+    # frontier, so one pass pops each parent and pushes its children
+    cells, sources = cells.tolist(), sources.tolist()
+    j = 0
+    for node in frontier.tolist():
+        here = _cell(node, width)
+        events.pop(here)
+        events.visit(here)
+        while j < len(cells) and sources[j] == node:
+            cell = _cell(cells[j], width)
+            events.relax(here, cell)
+            events.push(cell)
+            j += 1
+
+
+def _cell(flat, width):
+    r, c = divmod(flat, width)
+    return r - 1, c - 1
+
+
+def _flat(cell, width):
+    return (int(cell[0]) + 1) * width + int(cell[1]) + 1
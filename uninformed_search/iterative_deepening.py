@@ -0,0 +1,197 @@
+#iterative deepening search: repeated depth limited searches with a growing limit
+
+import os
+import pickle
+import tempfile
+
+
+def iterative_deepening_search(problem, cut_off_depth, resume=False, max_boundary=None,
+                               spill_dir=None, stats=None, events=None):
+    """Return the path to the shallowest goal within ``cut_off_depth``, or "failure".
+
+    The classic mode re-runs ``depth_limited_search`` from the root for every
+    limit and needs only O(d) memory.  With ``resume=True`` the nodes cut
+    off at one limit (with their paths, in depth-first order) are kept and
+    the next iteration continues from them, so no level is generated twice;
+    it returns the same path as the classic mode.  That boundary grows with
+    the branching factor, so once it holds more than ``max_boundary`` paths
+    the older ones are pickled to temporary files in ``spill_dir``.
+
+    Pass a dict as ``stats`` to get the number of nodes ``generated``; in
+    resume mode it also gets ``classic_generated``, what the classic mode
+    generates for the same iterations if each one, including the last,
+    regenerates every shallower level in full (an upper bound for the last
+    iteration, which may stop early), and ``spilled``, the number of paths
+    written to disk.  ``events`` takes an ``events.EventLog`` and records
+    every classic iteration one after the other; in resume mode a node is
+    pushed once, when it is generated, and popped when the iteration that
+    expands its boundary reaches it.
+    """
+    if resume:
+        return _resume_search(problem, cut_off_depth, max_boundary, spill_dir, stats, events)
+    if stats is not None:
+        stats["generated"] = 0
+    for depth in range(cut_off_depth):
+        result = depth_limited_search(problem, depth, stats, events)
+        if result != "cutoff" and result != "failure":
+            return result
+    return "failure"
+
+
+def depth_limited_search(problem, limit, stats=None, events=None):
+    """Depth-first search below ``limit``; returns a path, "cutoff" or "failure".
+
+    Frontier entries are just ``(node, depth)``.  Because the frontier is a
+    stack, the ancestors of a popped node at depth d are exactly the first
+    d entries of the current path, so one shared path list (and a set of
+    the nodes on it for O(1) cycle checks) is trimmed back to d on every
+    pop instead of copying the path into every frontier entry.  With a
+    ``stats`` dict the generated nodes are added to ``stats["generated"]``;
+    ``events`` takes an ``events.EventLog``.
+    """
+    # defining a frontier stack as it follows LIFO
+    frontier = [(problem.initial, 0)]  # (node, depth)
+    path = []
+    on_path = set()
+    result = "failure"
+    generated = 1
+    if events is not None:
+        events.push(problem.initial)
+    while frontier:
+        node, node_depth = frontier.pop()
+        if events is not None:
+            events.pop(node)
+            events.visit(node)
+        # backtrack to this node's parent
+        while len(path) > node_depth:
+            on_path.discard(path.pop())
+        path.append(node)
+        on_path.add(node)
+
+        if problem.is_goal(node):
+            result = list(path)
+            if events is not None:
+                events.goal(node)
+            break
+        if node_depth > limit:
+            result = "cutoff"
+        else:
+            for child in problem.expand(node):
+                if child not in on_path:
+                    frontier.append((child, node_depth + 1))
+                    generated += 1
+                    if events is not None:
+                        events.relax(node, child)
+                        events.push(child)
+    if stats is not None:
+        stats["generated"] = stats.get("generated", 0) + generated
+    return result
+
+
+def _resume_search(problem, cut_off_depth, max_boundary, spill_dir, stats, events=None):
+    # a depth limited search at limit L goal-tests every node down to depth
+    # L + 1 in depth-first order; the classic loop has already tested depth
+    # L at limit L - 1, so only the children of the old boundary are new.
+    # expanding the boundary in order, children in reverse expand() order
+    # (the order a stack pops them), visits them in the same order.  the
+    # boundary only stores path tuples; the set of nodes on a path is built
+    # once when it is expanded, so cycle checks are O(1) per child
+    generated = 1
+    shallower = 1   # nodes down to the current boundary, all regenerated by the classic loop
+    classic = 0
+    spilled = 0
+    result = "failure"
+    root = problem.initial
+    if events is not None:
+        events.push(root)
+    if cut_off_depth > 0 and problem.is_goal(root):
+        result = [root]
+        classic = 1
+        if events is not None:
+            events.pop(root)
+            events.visit(root)
+            events.goal(root)
+    boundary = _Boundary(max_boundary, spill_dir)
+    boundary.append((root,))
+    try:
+        for _ in range(cut_off_depth if result == "failure" else 0):
+            level = _Boundary(max_boundary, spill_dir)
+            for path in boundary:
+                node = path[-1]
+                if events is not None:
+                    events.pop(node)
+                    events.visit(node)
+                on_path = set(path)
+                for child in reversed(problem.expand(node)):
+                    if child in on_path:  # avoid cycles
+                        continue
+                    generated += 1
+                    child_path = path + (child,)
+                    if events is not None:
+                        events.relax(node, child)
+                        events.push(child)
+                    if problem.is_goal(child):
+                        result = list(child_path)
+                        if events is not None:
+                            events.pop(child)
+                            events.visit(child)
+                            events.goal(child)
+                        break
+                    level.append(child_path)
+                if result != "failure":
+                    break
+            spilled += boundary.spilled
+            boundary.close()
+            boundary = level
+            classic += shallower + len(level) + (result != "failure")
+            shallower += len(level)
+            if result != "failure" or not len(level):
+                break
+    finally:
+        spilled += boundary.spilled
+        boundary.close()
+
+    if stats is not None:
+        stats["generated"] = generated
+        stats["classic_generated"] = classic
+        stats["spilled"] = spilled
+    return result
+
+
+class _Boundary:
+    # append-only sequence of paths that keeps at most max_entries in memory
+    # and pickles older chunks to a temporary file, read back in order
+
+    def __init__(self, max_entries=None, spill_dir=None):
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self.spilled = 0
+        self._items = []
+        self._file = None
+        self._chunks = 0
+
+    def append(self, path):
+        self._items.append(path)
+        if self.max_entries is not None and len(self._items) > self.max_entries:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+            pickle.dump(self._items, self._file, pickle.HIGHEST_PROTOCOL)
+            self._chunks += 1
+            self.spilled += len(self._items)
+            self._items = []
+
+    def __len__(self):
+        return self.spilled + len(self._items)
+
+    def __iter__(self):
+        if self._file is not None:
+            self._file.seek(0)
+            for _ in range(self._chunks):
+                yield from pickle.load(self._file)
+            self._file.seek(0, os.SEEK_END)
+        yield from self._items
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
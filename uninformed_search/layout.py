@@ -0,0 +1,199 @@
+#force directed layout used by the graph animations
+import numpy as np
+
+# node count from which "auto" switches to the Barnes–Hut approximation
+BARNES_HUT_MIN_NODES = 2000
+# rows of the pairwise repulsion computed at once by the exact method
+_EXACT_BLOCK = 512
+
+
+# layout helpers
+def _edges_undirected(graph):
+    edges = set()
+    for u, nbrs in graph.items():
+        for v in nbrs:
+            if u == v:
+                continue
+            a, b = (u, v) if u < v else (v, u)
+            edges.add((a, b))
+    return sorted(edges)
+
+
+def force_directed_positions(graph, radius=16, iterations=250, seed=7, method="auto", theta=0.8,
+                             initial=None, fixed=None):
+    """Dependency-free spring layout (Fruchterman–Reingold style).
+
+    Every iteration is a handful of NumPy operations over all nodes and
+    edges.  ``method="exact"`` computes the all-pairs repulsion in blocks
+    of rows; ``"barnes_hut"`` approximates it with a quadtree, treating a
+    cell whose width over its distance is below ``theta`` as one mass at its
+    center, which is O(n log n) per iteration.  ``"auto"`` picks Barnes–Hut
+    from ``BARNES_HUT_MIN_NODES`` nodes on.  The output only depends on the
+    graph and the arguments.
+
+    ``initial`` warm-starts the layout from earlier positions for some or
+    all nodes; nodes without one start at the mean of their placed
+    neighbors.  The nodes in ``fixed`` keep their ``initial`` position, the
+    others start at a fifth of the usual temperature, and a warm-started
+    layout is neither re-centered nor rescaled, so the old picture stays
+    where it was.  ``LayoutCache`` uses this to relayout only
+    the neighborhood of a few changed edges.
+    """
+    if method == "auto":
+        method = "barnes_hut" if len(graph) >= BARNES_HUT_MIN_NODES else "exact"
+    if method == "exact":
+        repulsion = _exact_repulsion
+    elif method == "barnes_hut":
+        repulsion = _barnes_hut_repulsion
+    else:
+        raise ValueError(f"unknown layout method {method!r}, expected 'auto', 'exact' or 'barnes_hut'")
+
+    rng = np.random.default_rng(seed)
+    nodes = sorted(graph.keys())
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(node_to_idx[u], node_to_idx[v]) for u, v in _edges_undirected(graph)],
+                     dtype=np.int64).reshape(-1, 2)
+    src, dst = edges[:, 0], edges[:, 1]
+
+    # start in a rough circle with slight jitter (prevents symmetry lock)
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    pos = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    pos += rng.normal(scale=0.05, size=pos.shape)
+
+    # FR constants
+    k = np.sqrt(1.0 / n)
+    temperature = 0.15
+    movable = None
+    if initial:
+        pos = _warm_start(graph, nodes, node_to_idx, initial, radius, pos)
+        temperature /= 5
+        movable = np.ones(n, dtype=bool)
+        for node in fixed or ():
+            if node in node_to_idx and node in initial:
+                movable[node_to_idx[node]] = False
+
+    for it in range(iterations):
+        # repulsion (all pairs, or their quadtree approximation)
+        disp = repulsion(pos, k * k, theta)
+
+        # attraction (edges)
+        delta = pos[src] - pos[dst]
+        dist = np.sqrt(np.einsum("ij,ij->i", delta, delta)) + 1e-9
+        vec = delta * (dist / k)[:, None]   # unit vector times dist**2 / k
+        for axis in range(2):
+            disp[:, axis] -= np.bincount(src, weights=vec[:, axis], minlength=n)
+            disp[:, axis] += np.bincount(dst, weights=vec[:, axis], minlength=n)
+
+        # limit movement, cool down
+        t = temperature * (1.0 - (it / iterations))
+        d = np.sqrt(np.einsum("ij,ij->i", disp, disp)) + 1e-9
+        step = disp * (np.minimum(d, t) / d)[:, None]
+        if movable is None:
+            pos += step
+            # keep centered
+            pos -= np.mean(pos, axis=0)
+        else:
+            pos[movable] += step[movable]
+
+    if movable is None:
+        # scale to radius
+        max_norm = np.max(np.linalg.norm(pos, axis=1)) + 1e-9
+        pos = (pos / max_norm) * radius
+    else:
+        pos = pos * radius
+
+    return {node: (float(pos[i, 0]), float(pos[i, 1])) for i, node in enumerate(nodes)}
+
+
+def _warm_start(graph, nodes, node_to_idx, initial, radius, jitter):
+    # earlier positions back in the unit scale the iterations work in; new
+    # nodes go to the mean of their placed neighbors, plus the usual jitter
+    # so two new nodes never coincide
+    pos = np.zeros_like(jitter)
+    placed = np.zeros(len(nodes), dtype=bool)
+    for node, xy in initial.items():
+        i = node_to_idx.get(node)
+        if i is not None:
+            pos[i] = np.asarray(xy, dtype=float) / radius
+            placed[i] = True
+    for i in np.flatnonzero(~placed):
+        around = [node_to_idx[v] for v in graph[nodes[i]] if v in node_to_idx and placed[node_to_idx[v]]]
+        center = pos[around].mean(axis=0) if around else pos[placed].mean(axis=0) if placed.any() else 0
+        pos[i] = center + jitter[i] * 0.1
+    return pos
+
+
+def _exact_repulsion(pos, k2, theta=None):
+    # sum over j of unit(pos_i - pos_j) * k2 / dist_ij, a block of rows at a time
+    n = len(pos)
+    disp = np.empty_like(pos)
+    for lo in range(0, n, _EXACT_BLOCK):
+        delta = pos[lo:lo + _EXACT_BLOCK, None, :] - pos[None, :, :]
+        dist = np.sqrt(np.einsum("ijk,ijk->ij", delta, delta)) + 1e-9
+        # the self term has delta == 0 and adds nothing
+        disp[lo:lo + _EXACT_BLOCK] = np.einsum("ijk,ij->ik", delta, k2 / (dist * dist))
+    return disp
+
+
+def _barnes_hut_repulsion(pos, k2, theta):
+    # the quadtree is implicit: at level l a point sits in cell
+    # (x >> (depth - l), y >> (depth - l)) of its quantised coordinates, and
+    # every cell's mass and center come from a bincount.  the walk keeps a
+    # flat list of (point, cell) pairs: pairs that are far enough are
+    # approximated, the others are replaced by the cell's non-empty
+    # children, and pairs left at the leaves are summed exactly
+    n = len(pos)
+    depth = int(min(10, max(1, np.ceil(np.log2(max(n, 2)) / 2) + 1)))
+    low = pos.min(axis=0)
+    width = float(max(np.ptp(pos[:, 0]), np.ptp(pos[:, 1]))) + 1e-9
+    cells = 1 << depth
+    grid = np.minimum(((pos - low) / width * cells).astype(np.int64), cells - 1)
+    disp = np.zeros_like(pos)
+
+    def level_codes(level):
+        shift = depth - level
+        return ((grid[:, 0] >> shift) << level) | (grid[:, 1] >> shift)
+
+    points = np.repeat(np.arange(n), 4)
+    pair_cells = np.tile(np.arange(4), n)
+    for level in range(1, depth + 1):
+        codes = level_codes(level)
+        mass = np.bincount(codes, minlength=1 << (2 * level)).astype(float)
+        center = np.stack([np.bincount(codes, weights=pos[:, axis], minlength=len(mass))
+                           for axis in range(2)], axis=1)
+        keep = mass[pair_cells] > 0
+        points, pair_cells = points[keep], pair_cells[keep]
+        center_of = center[pair_cells] / mass[pair_cells][:, None]
+        delta = pos[points] - center_of
+        dist = np.sqrt(np.einsum("ij,ij->i", delta, delta)) + 1e-9
+        far = (codes[points] != pair_cells) & (width / (1 << level) < theta * dist)
+        if np.any(far):
+            force = delta[far] * (k2 * mass[pair_cells[far]] / (dist[far] * dist[far]))[:, None]
+            for axis in range(2):
+                disp[:, axis] += np.bincount(points[far], weights=force[:, axis], minlength=n)
+        points, pair_cells = points[~far], pair_cells[~far]
+        if level < depth:
+            # open the remaining cells into their four children
+            row, col = pair_cells >> level, pair_cells & ((1 << level) - 1)
+            children = [((2 * row + a) << (level + 1)) | (2 * col + b) for a in (0, 1) for b in (0, 1)]
+            points = np.repeat(points, 4)
+            pair_cells = np.stack(children, axis=1).ravel()
+
+    # exact sums against every point of the leaves that were never accepted
+    codes = level_codes(depth)
+    order = np.argsort(codes, kind="stable")
+    starts = np.searchsorted(codes[order], pair_cells, side="left")
+    counts = np.searchsorted(codes[order], pair_cells, side="right") - starts
+    targets = order[np.repeat(starts - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+                    + np.arange(counts.sum())]
+    sources = np.repeat(points, counts)
+    delta = pos[sources] - pos[targets]
+    dist = np.sqrt(np.einsum("ij,ij->i", delta, delta)) + 1e-9
+    force = delta * (k2 / (dist * dist))[:, None]
+    for axis in range(2):
+        disp[:, axis] += np.bincount(sources, weights=force[:, axis], minlength=n)
+    return disp
@@ -0,0 +1,203 @@
+#on-disk cache of graph layouts, so re-running a visualization of the same
+#graph does not pay for the layout again.  entries are .npz files named by a
+#fingerprint of the edge set and the layout parameters; index.json keeps
+#their sizes and last use for eviction
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .events import _from_json
+from .layout import _edges_undirected, force_directed_positions
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "uninformed_search", "layouts")
+
+
+class LayoutCache:
+    """Layouts stored under ``directory``, at most ``max_bytes`` in total.
+
+    ``layout(graph, kind, compute, **params)`` returns the cached positions
+    of ``graph`` for that layout ``kind`` and ``params``, or calls
+    ``compute(initial, fixed)`` and stores the result.  On a miss, the
+    positions of an entry with the same kind and params whose edge set
+    differs by at most ``max_changes`` edges are passed as ``initial``, and
+    every old node more than one hop from a changed edge as ``fixed``, so
+    ``compute`` only has to settle the changed neighborhood (both are None
+    when there is no such entry).  The least recently used entries are
+    deleted once the cache grows past ``max_bytes``.  Nodes must be ints,
+    strings or tuples of them so they survive a JSON round trip.
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2**20, max_changes=32):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_changes = max_changes
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._index_path = os.path.join(self.directory, "index.json")
+        self._index = self._read_index()
+        self._clock = max((entry["used"] for entry in self._index.values()), default=0)
+
+    def force_directed(self, graph, radius=16, iterations=250, seed=7, method="auto", theta=0.8):
+        """Cached ``force_directed_positions``; a warm start runs a fifth
+        of the iterations."""
+        def compute(initial, fixed):
+            if initial is None:
+                return force_directed_positions(graph, radius, iterations, seed, method, theta)
+            return force_directed_positions(graph, radius, max(1, iterations // 5), seed, method, theta,
+                                            initial=initial, fixed=fixed)
+
+        return self.layout(graph, "force_directed", compute, radius=radius, iterations=iterations,
+                           seed=seed, method=method, theta=theta)
+
+    def layout(self, graph, kind, compute, **params):
+        nodes = sorted(graph.keys())
+        edges = _edges_undirected(graph)
+        params_key = json.dumps([kind, sorted(params.items())], default=str)
+        key = _fingerprint(params_key, nodes, edges)
+
+        entry = self._index.get(key)
+        if entry is not None:
+            positions = self._load(key)
+            if positions is not None:
+                self.hits += 1
+                self._touch(key)
+                return positions
+
+        self.misses += 1
+        initial, fixed = self._nearest(params_key, nodes, edges)
+        if initial is not None:
+            # everything except the changed edges' endpoints and their neighbors stays put
+            moved = set(fixed)
+            for node in fixed:
+                moved.update(graph.get(node, ()))
+            fixed = set(initial).intersection(graph) - moved
+            if fixed:
+                self.warm_starts += 1
+            else:
+                initial = fixed = None
+        positions = compute(initial, fixed)
+        self._store(key, params_key, nodes, edges, positions)
+        return positions
+
+    def clear(self):
+        for key in list(self._index):
+            self._remove(key)
+        self._write_index()
+
+    def __len__(self):
+        return len(self._index)
+
+    #storage
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def _load(self, key):
+        try:
+            with np.load(self._path(key)) as data:
+                nodes = [_from_json(node) for node in json.loads(str(data["nodes"]))]
+                xy = data["positions"]
+        except (OSError, KeyError, ValueError):
+            # deleted or damaged behind our back
+            self._remove(key)
+            self._write_index()
+            return None
+        return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, xy)}
+
+    def _store(self, key, params_key, nodes, edges, positions):
+        xy = np.array([positions[node] for node in nodes], dtype=float).reshape(-1, 2)
+        tmp = self._path(key) + ".tmp.npz"
+        np.savez_compressed(tmp, nodes=np.array(json.dumps(nodes)), edges=np.array(json.dumps(edges)),
+                            positions=xy)
+        os.replace(tmp, self._path(key))
+        self._index[key] = {
+            "params": params_key,
+            "nodes": len(nodes),
+            "edges": len(edges),
+            "bytes": os.path.getsize(self._path(key)),
+            "used": 0,
+        }
+        self._touch(key)
+        self._evict(keep=key)
+
+    def _nearest(self, params_key, nodes, edges):
+        # positions of the most recently used entry with the same parameters
+        # whose edge set is at most max_changes edges away, and the nodes the
+        # difference touches; sizes rule most entries out cheaply
+        candidates = sorted(
+            (entry["used"], key) for key, entry in self._index.items()
+            if entry["params"] == params_key
+            and abs(entry["edges"] - len(edges)) <= self.max_changes
+            and abs(entry["nodes"] - len(nodes)) <= self.max_changes
+        )
+        if not candidates:
+            return None, None
+        wanted = {tuple(edge) for edge in edges}
+        for _, key in reversed(candidates[-4:]):
+            try:
+                with np.load(self._path(key)) as data:
+                    old_edges = {tuple(_from_json(edge)) for edge in json.loads(str(data["edges"]))}
+            except (OSError, KeyError, ValueError):
+                continue
+            changed = wanted ^ old_edges
+            if len(changed) <= self.max_changes:
+                positions = self._load(key)
+                if positions is not None:
+                    # the nodes touched by the change, returned in place of fixed
+                    touched = {node for edge in changed for node in edge}
+                    touched.update(node for node in nodes if node not in positions)
+                    return positions, touched
+        return None, None
+
+    def _touch(self, key):
+        self._clock += 1
+        self._index[key]["used"] = self._clock
+        self._write_index()
+
+    def _evict(self, keep=None):
+        total = sum(entry["bytes"] for entry in self._index.values())
+        for _, key in sorted((entry["used"], key) for key, entry in self._index.items()):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._index[key]["bytes"]
+            self._remove(key)
+        self._write_index()
+
+    def _remove(self, key):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _read_index(self):
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self._index_path)
+
+
+def _fingerprint(params_key, nodes, edges):
+    digest = hashlib.sha256()
+    digest.update(params_key.encode())
+    digest.update(json.dumps(nodes).encode())
+    digest.update(json.dumps(edges).encode())
+    return digest.hexdigest()[:32]
+
@@ -0,0 +1,174 @@
+#level-synchronous breadth first search over a CSR graph split between
+#worker processes.  every vertex has an owner range (contiguous ids); each
+#level the frontier is cut into slices that workers expand, the candidates
+#are bucketed by owner range, and at the level barrier one claim task per
+#range settles its new vertices.  graph, distances and parents live in
+#shared memory, but the candidates travel through the coordinating process
+#and a claim task runs on whichever worker is free
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import SharedCSRGraph, _open_block
+from .graph import CSRGraph
+from .spt import ShortestPathTree
+
+
+def parallel_bfs(graph, source, workers=None):
+    """Breadth first search from ``source`` over every reachable node.
+
+    Returns a ``ShortestPathTree`` whose ``cost`` array holds hop counts
+    (-1 where unreached) and whose ``parent`` array is exactly what a
+    one-node-at-a-time FIFO search such as ``bfs_path`` records: a vertex's
+    parent is the first frontier vertex, in queue order, that lists it as a
+    neighbor.  Candidates carry that order as a key (their position in the
+    concatenated adjacency lists of the frontier) and each owner keeps the
+    smallest key, so the answer does not depend on the number of workers.
+    ``workers=1`` runs in this process without a pool.  Nodes are the
+    integer ids ``0..n-1``: a dict graph must be keyed that way, and a
+    labelled ``CSRGraph`` is searched by ``id_of`` ids.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+        if graph.labels is not None:
+            raise ValueError("parallel_bfs needs a dict graph keyed 0..n-1; "
+                             "build a CSRGraph and pass graph.id_of(source) instead")
+    workers = workers or os.cpu_count() or 1
+    n = graph.num_nodes
+    source = int(source)
+
+    if workers == 1:
+        dist = np.full(n, -1, dtype=np.int64)
+        parent = np.full(n, -1, dtype=np.int64)
+        _attach_local(graph, dist, parent, 1)
+        try:
+            _run_levels(graph, source, dist, 1, map)
+        finally:
+            _attach_local(None, None, None, None)
+        return ShortestPathTree(source, dist, parent)
+
+    blocks = [shared_memory.SharedMemory(create=True, size=max(n * 8, 1)) for _ in range(2)]
+    try:
+        dist = np.ndarray(n, dtype=np.int64, buffer=blocks[0].buf)
+        parent = np.ndarray(n, dtype=np.int64, buffer=blocks[1].buf)
+        dist[:] = -1
+        parent[:] = -1
+        with SharedCSRGraph(graph) as shared:
+            initargs = (shared.spec, blocks[0].name, blocks[1].name, workers)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=initargs) as pool:
+                _run_levels(graph, source, dist, workers, pool.map)
+        result = ShortestPathTree(source, dist.copy(), parent.copy())
+    finally:
+        # the views must go before the blocks can be closed
+        dist = parent = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return result
+
+
+def _run_levels(graph, source, dist, parts, run):
+    # the coordinator: slices the frontier, routes candidates to their
+    # owners, and orders the claimed vertices into the next frontier
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        degrees = graph.indptr[frontier + 1] - graph.indptr[frontier]
+        offsets = np.concatenate([[0], np.cumsum(degrees)])
+        # slices with about the same number of edges each
+        cuts = np.searchsorted(offsets, np.linspace(0, offsets[-1], parts + 1)[1:-1])
+        bounds = np.concatenate([[0], cuts, [frontier.size]])
+        slices = [(frontier[lo:hi], offsets[lo]) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+        buckets = [[] for _ in range(parts)]
+        for routed in run(_expand, slices):
+            for owner, candidates in enumerate(routed):
+                if candidates[0].size:
+                    buckets[owner].append(candidates)
+        claims = [(level + 1, [np.concatenate(part) for part in zip(*bucket)])
+                  for bucket in buckets if bucket]
+
+        claimed = list(run(_claim, claims))
+        if not claimed:
+            break
+        vertices = np.concatenate([vertices for vertices, _ in claimed])
+        keys = np.concatenate([keys for _, keys in claimed])
+        frontier = vertices[np.argsort(keys, kind="stable")]
+        level += 1
+
+
+# worker side
+
+_worker_graph = None
+_worker_dist = None
+_worker_parent = None
+_worker_parts = None
+_worker_blocks = None
+
+
+def _init_worker(spec, dist_name, parent_name, parts):
+    global _worker_graph, _worker_dist, _worker_parent, _worker_parts, _worker_blocks
+    _worker_graph, blocks = SharedCSRGraph.attach(spec)
+    dist_block = _open_block(dist_name)
+    parent_block = _open_block(parent_name)
+    n = _worker_graph.num_nodes
+    _worker_dist = np.ndarray(n, dtype=np.int64, buffer=dist_block.buf)
+    _worker_parent = np.ndarray(n, dtype=np.int64, buffer=parent_block.buf)
+    _worker_parts = parts
+    _worker_blocks = blocks + [dist_block, parent_block]
+
+
+def _attach_local(graph, dist, parent, parts):
+    global _worker_graph, _worker_dist, _worker_parent, _worker_parts
+    _worker_graph = graph
+    _worker_dist = dist
+    _worker_parent = parent
+    _worker_parts = parts
+
+
+def _owner(vertices):
+    n = _worker_graph.num_nodes
+    return vertices * _worker_parts // max(n, 1)
+
+
+def _expand(task):
+    # every unvisited neighbor of a frontier slice as (vertex, key, parent),
+    # split by owner.  dist is only written at the barrier, so reading it
+    # here is race free
+    frontier, base = task
+    indptr, indices = _worker_graph.indptr, _worker_graph.indices
+    starts = indptr[frontier]
+    degrees = indptr[frontier + 1] - starts
+    total = int(degrees.sum())
+    # position of every edge of the slice inside indices
+    first = np.repeat(starts - np.concatenate([[0], np.cumsum(degrees)[:-1]]), degrees)
+    targets = indices[first + np.arange(total)].astype(np.int64)
+    keys = base + np.arange(total, dtype=np.int64)
+    sources = np.repeat(frontier, degrees)
+    fresh = _worker_dist[targets] < 0
+    targets, keys, sources = targets[fresh], keys[fresh], sources[fresh]
+    # one stable sort by owner keeps every owner's candidates in key order;
+    # numpy radix-sorts 16-bit keys, which beats a comparison sort here
+    owners = _owner(targets)
+    if _worker_parts < 2**15:
+        owners = owners.astype(np.int16)
+    order = np.argsort(owners, kind="stable")
+    targets, keys, sources = targets[order], keys[order], sources[order]
+    bounds = np.searchsorted(owners[order], np.arange(_worker_parts + 1))
+    return [(targets[lo:hi], keys[lo:hi], sources[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def _claim(task):
+    # an owner keeps the smallest-key candidate of each of its vertices
+    depth, (targets, keys, sources) = task
+    order = np.argsort(keys, kind="stable")
+    targets, keys, sources = targets[order], keys[order], sources[order]
+    targets, first = np.unique(targets, return_index=True)
+    _worker_dist[targets] = depth
+    _worker_parent[targets] = sources[first]
+    return targets, keys[first]
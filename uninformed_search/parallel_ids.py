@@ -0,0 +1,127 @@
+#iterative deepening split into subtrees that a process pool searches at once
+#the root is expanded serially down to split_depth; every node at that depth
+#roots one task, and the tasks share a "best (depth, subtree)" value so a
+#worker gives up as soon as it can no longer beat a goal found elsewhere
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
+
+from .iterative_deepening import iterative_deepening_search
+
+# how many pops a worker makes between looks at the shared best value
+CHECK_EVERY = 1024
+
+
+def parallel_iterative_deepening_search(problem, cut_off_depth, split_depth=3, workers=None):
+    """``iterative_deepening_search`` with the subtrees below ``split_depth``
+    searched in parallel; returns the same path or "failure".
+
+    The serial search returns the first goal, in depth-first order, of the
+    first limit that has one.  Subtree roots are listed in that same order,
+    so the answer is the goal of the smallest ``(depth, subtree index)``.
+    Each task deepens its own subtree and stops once a shallower goal, or
+    one at the same depth in an earlier subtree, has been reported.  Tasks
+    are handed out one at a time, so idle workers pick up the remaining
+    subtrees as the others finish.  ``problem`` must be picklable.
+    """
+    if cut_off_depth <= split_depth:
+        return iterative_deepening_search(problem, cut_off_depth)
+    # limits below split_depth only reach nodes the split itself visits
+    result = iterative_deepening_search(problem, split_depth)
+    if result != "failure":
+        return result
+
+    roots = _split(problem, split_depth)
+    if not roots:
+        return "failure"
+    workers = workers or os.cpu_count() or 1
+    # (depth, index) of the best goal so far, packed into one integer
+    best = Value("q", (cut_off_depth + 1) * len(roots))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(problem, cut_off_depth, len(roots), best)) as pool:
+        found = [hit for hit in pool.map(_search_subtree, enumerate(roots)) if hit is not None]
+    if not found:
+        return "failure"
+    return list(min(found)[2])
+
+
+def _split(problem, depth):
+    # paths to every node at ``depth``, in the order the serial stack pops them
+    level = [(problem.initial,)]
+    for _ in range(depth):
+        level = [path + (child,)
+                 for path in level
+                 for child in reversed(problem.expand(path[-1]))
+                 if child not in path]
+    return level
+
+
+# worker side
+
+_worker_problem = None
+_worker_cut_off = None
+_worker_roots = None
+_worker_best = None
+
+
+def _init_worker(problem, cut_off_depth, roots, best):
+    global _worker_problem, _worker_cut_off, _worker_roots, _worker_best
+    _worker_problem = problem
+    _worker_cut_off = cut_off_depth
+    _worker_roots = roots
+    _worker_best = best
+
+
+def _search_subtree(task):
+    index, root_path = task
+    for depth in range(len(root_path), _worker_cut_off + 1):
+        if _beaten(depth, index):
+            return None
+        path, reached = _search_to(root_path, depth, index)
+        if path is not None:
+            key = depth * _worker_roots + index
+            with _worker_best.get_lock():
+                if key < _worker_best.value:
+                    _worker_best.value = key
+            return depth, index, path
+        if not reached:
+            # nothing is left at this depth, so nothing deeper either
+            return None
+    return None
+
+
+def _beaten(depth, index):
+    return _worker_best.value <= depth * _worker_roots + index
+
+
+def _search_to(root_path, depth, index):
+    # the depth limited search of iterative_deepening, started from a
+    # subtree root and only testing goals down to ``depth``.  returns
+    # (goal path or None, whether any node at ``depth`` exists)
+    problem = _worker_problem
+    start = len(root_path) - 1
+    path = list(root_path[:-1])
+    on_path = set(path)
+    frontier = [(root_path[-1], start)]
+    reached = False
+    pops = 0
+    while frontier:
+        pops += 1
+        if pops % CHECK_EVERY == 0 and _beaten(depth, index):
+            return None, False
+        node, node_depth = frontier.pop()
+        while len(path) > node_depth:
+            on_path.discard(path.pop())
+        path.append(node)
+        on_path.add(node)
+
+        if problem.is_goal(node):
+            return tuple(path), True
+        if node_depth == depth:
+            reached = True
+        else:
+            for child in problem.expand(node):
+                if child not in on_path:
+                    frontier.append((child, node_depth + 1))
+    return None, reached and not _beaten(depth, index)
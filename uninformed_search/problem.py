@@ -0,0 +1,79 @@
+#grid search problem shared by depth limited and iterative deepening search
+#grid is a list of lists (or numpy array) where 0 = free and 1 = obstacle
+
+import numpy as np
+
+
+class Problem:
+    def __init__(self, grid, initial, goal):
+        self.grid = grid
+        self.initial = initial
+        self.goal = goal
+
+    def is_goal(self, position):
+        return position == self.goal
+
+    def is_cycle(self, position, path):
+        return position in path
+
+    def expand(self, position):
+        moves = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # right, down, left, up
+        result = []
+        for move in moves:
+            new_position = (position[0] + move[0], position[1] + move[1])
+            if (0 <= new_position[0] < len(self.grid) and
+                0 <= new_position[1] < len(self.grid[0]) and
+                self.grid[new_position[0]][new_position[1]] == 0):
+                result.append(new_position)
+        return result
+
+
+class GridProblem(Problem):
+    """Grid problem whose moves are precomputed once per grid.
+
+    ``grid`` may be a list of lists or a NumPy occupancy array (0 = free).
+    Bit ``d`` of ``open_dirs[i]`` is set when move ``d`` (right, down, left,
+    up) from flat cell ``i`` lands on a free cell.  ``expand`` builds a cell's tuple of neighbor
+    positions from its mask the first time the cell is expanded and returns
+    that same tuple afterwards, so setup stays O(cells) in NumPy and only
+    cells the search actually reaches cost Python objects.
+    """
+
+    moves = ((0, 1), (1, 0), (0, -1), (-1, 0))  # right, down, left, up
+
+    def __init__(self, grid, initial, goal):
+        super().__init__(grid, initial, goal)
+        occupancy = np.asarray(grid)
+        self.rows, self.cols = occupancy.shape
+        self.open_dirs = _open_dirs(occupancy == 0)
+        self._masks = self.open_dirs.tobytes()   # indexing bytes gives a plain int
+        self._expansions = {}                    # flat index -> neighbor tuple
+
+    def expand(self, position):
+        i = position[0] * self.cols + position[1]
+        expansion = self._expansions.get(i)
+        if expansion is None:
+            r, c = position
+            expansion = self._expansions[i] = tuple(
+                (r + dr, c + dc) for dr, dc in _MOVES_OF_MASK[self._masks[i]]
+            )
+        return expansion
+
+
+# the moves, in GridProblem.moves order, that each open_dirs bitmask allows
+_MOVES_OF_MASK = [
+    tuple(move for d, move in enumerate(GridProblem.moves) if mask >> d & 1) for mask in range(16)
+]
+
+
+def _open_dirs(free):
+    rows, cols = free.shape
+    # pad with walls so no move needs a bounds check
+    padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = free
+
+    open_dirs = np.zeros(rows * cols, dtype=np.uint8)
+    for d, (dr, dc) in enumerate(GridProblem.moves):
+        target_free = padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+        open_dirs[target_free.ravel()] |= np.uint8(1 << d)
+    return open_dirs
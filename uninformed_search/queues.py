@@ -0,0 +1,323 @@
+#priority queues that uniform cost search can run on
+#every queue has push(priority, node), pop() -> (priority, node) and len(),
+#and counts its own pushes, pops and decrease-key operations
+#entries are ordered by (priority, node) so all queues settle nodes in the
+#same order as the plain heapq version and return identical paths
+
+import heapq
+
+
+class HeapQueue:
+    """``heapq`` with lazy deletion: an improved cost is pushed as a new
+    entry and the old one is left behind to be skipped as stale."""
+
+    def __init__(self):
+        self._heap = []
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+
+    def push(self, priority, node):
+        heapq.heappush(self._heap, (priority, node))
+        self.pushes += 1
+
+    def pop(self):
+        self.pops += 1
+        return heapq.heappop(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class IndexedBinaryHeap:
+    """Binary heap with a node -> slot index and a real decrease-key.
+
+    Each node has at most one entry, so the heap never holds more than the
+    number of open nodes and no stale entries are ever popped.
+    """
+
+    def __init__(self):
+        self._heap = []   # [(priority, node), ...]
+        self._slot = {}   # node -> index into _heap
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+
+    def push(self, priority, node):
+        slot = self._slot.get(node)
+        if slot is None:
+            self._heap.append((priority, node))
+            self._slot[node] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            self.pushes += 1
+        elif (priority, node) < self._heap[slot]:
+            self._heap[slot] = (priority, node)
+            self._sift_up(slot)
+            self.decreases += 1
+
+    def pop(self):
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        del self._slot[top[1]]
+        if heap:
+            heap[0] = last
+            self._slot[last[1]] = 0
+            self._sift_down(0)
+        self.pops += 1
+        return top
+
+    def __contains__(self, node):
+        return node in self._slot
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _sift_up(self, i):
+        heap, slot = self._heap, self._slot
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if item < heap[parent]:
+                heap[i] = heap[parent]
+                slot[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = item
+        slot[item[1]] = i
+
+    def _sift_down(self, i):
+        heap, slot = self._heap, self._slot
+        n = len(heap)
+        item = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < item:
+                heap[i] = heap[child]
+                slot[heap[i][1]] = i
+                i = child
+            else:
+                break
+        heap[i] = item
+        slot[item[1]] = i
+
+
+class _PairingNode:
+    __slots__ = ("key", "child", "next", "prev")
+
+    def __init__(self, key):
+        self.key = key      # (priority, node)
+        self.child = None   # leftmost child
+        self.next = None    # right sibling
+        self.prev = None    # left sibling, or parent for a leftmost child
+
+
+class PairingHeap:
+    """Pairing heap with O(1) insert and decrease-key (amortised
+    O(log n) pop), keeping one handle per queued node."""
+
+    def __init__(self):
+        self._root = None
+        self._handles = {}
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+
+    def push(self, priority, node):
+        handle = self._handles.get(node)
+        if handle is None:
+            handle = _PairingNode((priority, node))
+            self._handles[node] = handle
+            self._root = handle if self._root is None else _meld(self._root, handle)
+            self.pushes += 1
+        elif (priority, node) < handle.key:
+            handle.key = (priority, node)
+            if handle is not self._root:
+                _cut(handle)
+                self._root = _meld(self._root, handle)
+            self.decreases += 1
+
+    def pop(self):
+        root = self._root
+        del self._handles[root.key[1]]
+        self._root = _merge_pairs(root.child)
+        if self._root is not None:
+            self._root.prev = None
+        self.pops += 1
+        return root.key
+
+    def __contains__(self, node):
+        return node in self._handles
+
+    def __len__(self):
+        return len(self._handles)
+
+
+def _meld(a, b):
+    if b.key < a.key:
+        a, b = b, a
+    b.prev = a
+    b.next = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+def _cut(handle):
+    # detach a subtree from its parent / siblings
+    if handle.prev.child is handle:
+        handle.prev.child = handle.next
+    else:
+        handle.prev.next = handle.next
+    if handle.next is not None:
+        handle.next.prev = handle.prev
+    handle.next = handle.prev = None
+
+
+def _merge_pairs(first):
+    # standard two-pass pairing: meld neighbours left to right,
+    # then fold the results right to left
+    pairs = []
+    while first is not None:
+        a = first
+        b = a.next
+        first = b.next if b is not None else None
+        a.next = a.prev = None
+        if b is not None:
+            b.next = b.prev = None
+            a = _meld(a, b)
+        pairs.append(a)
+    if not pairs:
+        return None
+    root = pairs.pop()
+    while pairs:
+        root = _meld(pairs.pop(), root)
+    return root
+
+
+class DialQueue:
+    """Dial's bucket queue for integer costs in ``0..max_weight``.
+
+    Uniform cost search only ever pushes costs between the current minimum
+    and the minimum plus the largest edge weight, so ``max_weight + 1``
+    buckets reused in a circle cover every live entry.  Each bucket is a
+    small heap of nodes to keep the (priority, node) order.
+    """
+
+    def __init__(self, max_weight):
+        self._buckets = [[] for _ in range(int(max_weight) + 1)]
+        self._cost = 0
+        self._size = 0
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+
+    def push(self, priority, node):
+        heapq.heappush(self._buckets[priority % len(self._buckets)], node)
+        self._size += 1
+        self.pushes += 1
+
+    def pop(self):
+        buckets = self._buckets
+        width = len(buckets)
+        while not buckets[self._cost % width]:
+            self._cost += 1
+        node = heapq.heappop(buckets[self._cost % width])
+        self._size -= 1
+        self.pops += 1
+        return self._cost, node
+
+    def __len__(self):
+        return self._size
+
+
+class RadixHeap:
+    """Radix heap for monotone non-negative integer costs.
+
+    An entry lives in bucket ``(priority ^ last).bit_length()`` where
+    ``last`` is the last popped cost; when bucket 0 runs dry the first
+    non-empty bucket is split around its minimum.  Bucket 0 (costs equal to
+    ``last``) is a heap of nodes so ties pop in node order.
+    """
+
+    def __init__(self):
+        self._buckets = [[]]
+        self._last = 0
+        self._size = 0
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+
+    def push(self, priority, node):
+        self._place(priority, node)
+        self._size += 1
+        self.pushes += 1
+
+    def pop(self):
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries = buckets[i]
+            buckets[i] = []
+            self._last = min(entries)[0]
+            for priority, node in entries:
+                self._place(priority, node)
+        node = heapq.heappop(buckets[0])
+        self._size -= 1
+        self.pops += 1
+        return self._last, node
+
+    def __len__(self):
+        return self._size
+
+    def _place(self, priority, node):
+        i = (priority ^ self._last).bit_length()
+        if i == 0:
+            heapq.heappush(self._buckets[0], node)
+            return
+        while len(self._buckets) <= i:
+            self._buckets.append([])
+        self._buckets[i].append((priority, node))
+
+
+# largest edge weight for which "auto" picks Dial's buckets over a radix heap
+DIAL_MAX_WEIGHT = 4096
+
+QUEUES = {
+    "heapq": HeapQueue,
+    "binary": IndexedBinaryHeap,
+    "pairing": PairingHeap,
+    "dial": DialQueue,
+    "radix": RadixHeap,
+}
+
+
+def make_queue(strategy, max_weight=None):
+    """Return an empty queue for a strategy name from ``QUEUES``.
+
+    ``"dial"`` needs ``max_weight``, the largest edge cost in the graph.
+    """
+    if strategy == "dial":
+        if max_weight is None:
+            raise ValueError("the dial queue needs max_weight")
+        return DialQueue(max_weight)
+    try:
+        return QUEUES[strategy]()
+    except KeyError:
+        raise ValueError(f"unknown queue strategy {strategy!r}, expected one of {sorted(QUEUES)}") from None
+
+
+def choose_queue(max_weight):
+    """Pick a strategy for graphs whose costs are all integers in
+    ``0..max_weight`` (``max_weight`` is None when they are not)."""
+    if max_weight is None:
+        return "heapq"
+    return "dial" if max_weight <= DIAL_MAX_WEIGHT else "radix"
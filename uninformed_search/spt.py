@@ -0,0 +1,87 @@
+#one-to-all shortest path trees that answer many goals from one UCS run
+
+import numpy as np
+
+from .graph import CSRGraph, integer_weight_bound
+from .ucs import _settle
+
+
+class ShortestPathTree:
+    """Settled costs and parents of a uniform cost search from ``source``.
+
+    For CSR graphs (integer node ids) ``cost`` and ``parent`` are NumPy
+    arrays indexed by node id, with ``parent == -1`` marking the source and
+    unreached nodes; for dict graphs they are dicts.  Only nodes whose cost
+    was final when the search stopped are stored.
+    """
+
+    def __init__(self, source, cost, parent):
+        self.source = source
+        self.cost = cost
+        self.parent = parent
+        self._arrays = isinstance(parent, np.ndarray)
+
+    def __contains__(self, node):
+        if self._arrays:
+            return 0 <= node < len(self.parent) and (node == self.source or self.parent[node] >= 0)
+        return node in self.cost
+
+    def __len__(self):
+        if self._arrays:
+            return int(np.count_nonzero(self.parent >= 0)) + 1
+        return len(self.cost)
+
+    def cost_to(self, node):
+        """Cost of the cheapest source->node path, or None if not settled."""
+        if node not in self:
+            return None
+        return self.cost[node].item() if self._arrays else self.cost[node]
+
+    def path_to(self, node):
+        """Cheapest source->node path, or None if not settled."""
+        if node not in self:
+            return None
+        path = []
+        if self._arrays:
+            parent = self.parent
+            while node != self.source:
+                path.append(node)
+                node = int(parent[node])
+        else:
+            parent = self.parent
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            path.pop()
+        path.append(self.source)
+        path.reverse()
+        return path
+
+
+def shortest_path_tree(graph, source, goals=None, queue="auto", stats=None, events=None):
+    """Run uniform cost search from ``source`` and keep the whole tree.
+
+    The search runs to completion, or stops as soon as every node in
+    ``goals`` is settled.  ``queue``, ``stats`` and ``events`` work as in
+    ``uniform_cost_search``.
+    """
+    visited, closed = _settle(graph, source, goals, queue, stats, events)
+
+    if isinstance(graph, CSRGraph):
+        n = graph.num_nodes
+        integer = integer_weight_bound(graph) is not None
+        cost = np.zeros(n, dtype=np.int64 if integer else np.float64)
+        parent = np.full(n, -1, dtype=np.int64 if n >= 2**31 else np.int32)
+        nodes = np.fromiter(closed, dtype=np.int64, count=len(closed))
+        cost[nodes] = [visited[v][0] for v in nodes.tolist()]
+        if not integer:
+            # unreached nodes read as infinitely far away
+            unreached = np.ones(n, dtype=bool)
+            unreached[nodes] = False
+            cost[unreached] = np.inf
+        parent[nodes] = [-1 if visited[v][1] is None else visited[v][1] for v in nodes.tolist()]
+        return ShortestPathTree(source, cost, parent)
+
+    cost = {node: visited[node][0] for node in closed}
+    parent = {node: visited[node][1] for node in closed}
+    return ShortestPathTree(source, cost, parent)
@@ -0,0 +1,236 @@
+#uniform cost search on a weighted adjacency list
+#graph[node] is a list of (neighbor, cost) tuples, or a CSRGraph
+
+import heapq
+
+import numpy as np
+
+from .graph import CSRGraph, integer_weight_bound, weighted_neighbor_fn
+from .queues import choose_queue, make_queue
+
+
+def reconstruct_path(visited, start, goal):
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = visited[current][1]
+    path.reverse()
+    return path
+
+
+def uniform_cost_search(graph, start, goal, queue="auto", stats=None, events=None):
+    """Return ``(cost, path)`` of the cheapest start->goal path, or None.
+
+    ``queue`` picks the priority queue from ``queues.QUEUES``: ``"heapq"``
+    pushes duplicates and skips them as stale when popped, ``"binary"`` and
+    ``"pairing"`` keep one entry per node and use decrease-key, ``"dial"``
+    and ``"radix"`` are bucket queues for integer costs.  ``"auto"`` uses a
+    bucket queue for a ``CSRGraph`` whose costs are all non-negative
+    integers (checked once and cached on the graph) and heapq otherwise;
+    dict graphs always get heapq, since checking their costs would read
+    every edge before the search starts.  A node is expanded at most once
+    either way, and every queue returns the same path.  Pass a dict as
+    ``stats`` to get the chosen ``queue`` and the ``pushes``, ``pops``,
+    ``stale_pops``, ``decreases`` and ``expanded`` counts, and an
+    ``events.EventLog`` as ``events`` to record the search.
+    """
+    visited, closed = _settle(graph, start, (goal,), queue, stats, events)
+    if goal not in closed:
+        return None
+    return visited[goal][0], reconstruct_path(visited, start, goal)
+
+
+def _settle(graph, start, goals, queue, stats, events=None):
+    """Core UCS loop shared by the single-goal and shortest-path-tree modes.
+
+    Runs until every node in ``goals`` is expanded, or until the queue is
+    empty when ``goals`` is None.  Returns ``(visited, closed)`` where
+    ``visited[node] = (cost, parent)``; the costs of nodes in ``closed`` are
+    final.
+    """
+    edges = weighted_neighbor_fn(graph)
+    max_weight = None
+    if queue == "auto":
+        # only a CSR graph knows its weight bound without a full scan
+        if isinstance(graph, CSRGraph):
+            max_weight = integer_weight_bound(graph)
+        queue = choose_queue(max_weight)
+    elif queue == "dial":
+        max_weight = integer_weight_bound(graph)
+    frontier = make_queue(queue, max_weight)
+    remaining = None if goals is None else set(goals)
+    #initialising the priority queue with the start node and cost 0
+    frontier.push(0, start)
+    if events is not None:
+        events.push(start)
+    visited = {start: (0, None)}
+    # Dictionary to store the cost and parent of each visited node
+    closed = set()
+    stale_pops = 0
+    while frontier:
+        # Pop the node with the lowest cost
+        cost, node = frontier.pop()
+        if events is not None:
+            events.pop(node)
+        if node in closed:
+            # an older, more expensive entry for a node we already expanded
+            stale_pops += 1
+            continue
+        closed.add(node)
+        if events is not None:
+            events.visit(node)
+
+        #stop once every requested goal has its final cost
+        if remaining is not None and node in remaining:
+            remaining.discard(node)
+            if events is not None:
+                events.goal(node)
+            if not remaining:
+                break
+
+        #exploring the neighbors of the current node
+        for neighbor, edge_cost in edges(node):
+            if neighbor in closed:
+                continue
+            total_cost = cost + edge_cost
+            if events is not None:
+                events.relax(node, neighbor, edge_cost)
+
+            #check if previously visited or not
+            if neighbor not in visited or total_cost < visited[neighbor][0]:
+                visited[neighbor] = (total_cost, node)
+                frontier.push(total_cost, neighbor)
+                if events is not None:
+                    events.push(neighbor)
+
+    if stats is not None:
+        stats["queue"] = queue
+        _record_stats(stats, frontier, stale_pops, len(closed))
+    return visited, closed
+
+
+def _record_stats(stats, frontier, stale_pops, expanded):
+    stats["pushes"] = frontier.pushes
+    stats["pops"] = frontier.pops
+    stats["stale_pops"] = stale_pops
+    stats["decreases"] = frontier.decreases
+    stats["expanded"] = expanded
+
+
+def reverse_adjacency(graph):
+    """Return the graph with every edge flipped, in the same format.
+
+    The reverse of a CSR graph is built once and cached on it (the graph
+    is static); a dict is flipped again on every call.
+    """
+    if isinstance(graph, CSRGraph):
+        if graph._reverse is None:
+            sources = np.repeat(np.arange(graph.num_nodes), np.diff(graph.indptr))
+            graph._reverse = CSRGraph.from_edges(graph.num_nodes, graph.indices, sources, graph.weights,
+                                                 labels=graph.labels)
+            graph._reverse._reverse = graph
+        return graph._reverse
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, cost in edges:
+            reverse.setdefault(neighbor, []).append((node, cost))
+    return reverse
+
+
+def bidirectional_ucs(graph, start, goal, reverse=None, directed=None, stats=None, events=None):
+    """Uniform cost search run from both ends at once.
+
+    The forward search follows ``graph`` and the backward search follows
+    ``reverse`` (built with ``reverse_adjacency`` for directed graphs, or the
+    graph itself when ``directed`` is False; CSR graphs default to their own
+    ``directed`` flag, dicts to directed).  The side with the cheaper heap top
+    is expanded next, and the search stops once the two heap tops together
+    cost at least as much as the best meeting path, which is then optimal.
+
+    Building the reverse of a dict graph reads every edge, which costs more
+    than a short query saves, so callers running many queries on a dict
+    should build it once with ``reverse_adjacency`` and pass it as
+    ``reverse``, or pass ``directed=False`` when every edge is listed both
+    ways.  A CSR graph caches its reverse after the first query.
+
+    Returns ``(cost, path)`` like ``uniform_cost_search``, or None.  Pass a
+    dict as ``stats`` to get the number of ``settled`` nodes and ``pushes``,
+    and an ``events.EventLog`` as ``events`` to record both sides of the
+    search, with the meeting node as the goal.
+    """
+    if directed is None:
+        directed = graph.directed if isinstance(graph, CSRGraph) else True
+    if reverse is None:
+        reverse = reverse_adjacency(graph) if directed else graph
+
+    forward = _Side(weighted_neighbor_fn(graph), start)
+    backward = _Side(weighted_neighbor_fn(reverse), goal)
+    best = 0 if start == goal else float("inf")
+    meet = start if start == goal else None
+    if events is not None:
+        events.push(start)
+        if goal != start:
+            events.push(goal)
+
+    while forward.heap and backward.heap:
+        if forward.heap[0][0] + backward.heap[0][0] >= best:
+            break
+        side, other = (forward, backward) if forward.heap[0][0] <= backward.heap[0][0] else (backward, forward)
+        cost, node = heapq.heappop(side.heap)
+        if events is not None:
+            events.pop(node)
+        if node in side.settled or cost > side.dist[node]:
+            continue  # stale entry
+        side.settled.add(node)
+        if events is not None:
+            events.visit(node)
+
+        for neighbor, edge_cost in side.edges(node):
+            total_cost = cost + edge_cost
+            if events is not None:
+                events.relax(node, neighbor, edge_cost)
+            if neighbor not in side.dist or total_cost < side.dist[neighbor]:
+                side.dist[neighbor] = total_cost
+                side.parent[neighbor] = node
+                heapq.heappush(side.heap, (total_cost, neighbor))
+                side.pushes += 1
+                if events is not None:
+                    events.push(neighbor)
+            # the meet is only checked where the two searches touch
+            if neighbor in other.dist and total_cost + other.dist[neighbor] < best:
+                best = total_cost + other.dist[neighbor]
+                meet = neighbor
+
+    if stats is not None:
+        stats["settled"] = len(forward.settled) + len(backward.settled)
+        stats["pushes"] = forward.pushes + backward.pushes
+
+    if meet is None:
+        return None
+    if events is not None:
+        events.goal(meet)
+    path = _walk(forward.parent, meet)
+    path.reverse()
+    path.extend(_walk(backward.parent, meet)[1:])
+    return best, path
+
+
+class _Side:
+    # state of one direction of the bidirectional search
+    def __init__(self, edges, root):
+        self.edges = edges
+        self.heap = [(0, root)]
+        self.dist = {root: 0}
+        self.parent = {root: None}
+        self.settled = set()
+        self.pushes = 1
+
+
+def _walk(parent, node):
+    # node, parent[node], ... up to the root
+    nodes = []
+    while node is not None:
+        nodes.append(node)
+        node = parent[node]
+    return nodes
@@ -0,0 +1,443 @@
+#matplotlib / networkx visualizers for the search results
+#plotting libraries are imported inside each function so that importing the
+#package (e.g. in a headless worker) never pays for matplotlib's import time
+
+import numpy as np
+
+
+def vis_graph(graph, path):
+    """Draw a weighted adjacency list and highlight the UCS path."""
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    from matplotlib import colormaps
+
+    G = nx.Graph()
+
+    #adding nodes and edges to the graph
+    for nodes, edges in graph.items():
+        for neighbor, cost in edges:
+            G.add_edge(nodes, neighbor, weight=cost)
+
+    # Use a circular layout for better separation and less overlap
+    pos = nx.circular_layout(G)
+
+    plt.figure(figsize=(12, 8))
+    ax = plt.gca()
+    ax.set_facecolor('black')
+    plt.gcf().patch.set_facecolor('black')
+
+    # Identify node types
+    start_node = path[0] if path else None
+    goal_node = path[-1] if path else None
+    intermediate_nodes = set(path[1:-1]) if path and len(path) > 2 else set()
+    # Draw all nodes with different colors for start, goal, and intermediate
+    node_colors = []
+    for node in G.nodes():
+        if node == start_node:
+            node_colors.append('#00ff00')  # Green for start
+        elif node == goal_node:
+            node_colors.append('#ff0000')  # Red for goal
+        elif node in intermediate_nodes:
+            node_colors.append('#ffb347')  # Orange for path
+        else:
+            node_colors.append('#aee9f5')  # Default
+    nx.draw_networkx_nodes(G, pos, node_color=node_colors, node_size=1200, edgecolors='white', linewidths=2, alpha=0.95)
+    # Draw all edges
+    nx.draw_networkx_edges(G, pos, edge_color='#b0b0b0', width=2, alpha=0.7)
+    # Add node labels with type, offsetting labels to avoid overlap
+    node_labels = {}
+    label_pos = {}
+    for node in G.nodes():
+        if node == start_node:
+            node_labels[node] = f"{node}\n(Start)"
+        elif node == goal_node:
+            node_labels[node] = f"{node}\n(Goal)"
+        elif node in intermediate_nodes:
+            node_labels[node] = f"{node}\n(Path)"
+        else:
+            node_labels[node] = node
+        # Offset label positions slightly outward from the node
+        x, y = pos[node]
+        angle = np.arctan2(y, x)
+        label_pos[node] = (x + 0.15 * np.cos(angle), y + 0.15 * np.sin(angle))
+    nx.draw_networkx_labels(G, label_pos, labels=node_labels, font_size=14, font_weight='bold', font_color='white', bbox=dict(facecolor='black', edgecolor='white', boxstyle='round,pad=0.3', alpha=0.8))
+    # Draw edge weights
+    labels = nx.get_edge_attributes(G, 'weight')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=12, font_color='#1a5276', bbox=dict(facecolor='white', edgecolor='none', alpha=0.6), label_pos=0.6)
+
+    if path:
+        # Only draw edges that exist in the graph
+        path_edges = [(path[i], path[i+1]) for i in range(len(path)-1) if G.has_edge(path[i], path[i+1])]
+        # Draw the path with a gradient color
+        colors = colormaps['autumn'](np.linspace(0, 1, len(path_edges)))
+        for idx, edge in enumerate(path_edges):
+            nx.draw_networkx_edges(G, pos, edgelist=[edge], edge_color=[colors[idx]], width=6, alpha=0.9, arrows=True, arrowstyle='-|>', arrowsize=30)
+        plt.text(0.01, 0.01, f"Path: {' → '.join(map(str, path))}", fontsize=14, color='#ffb347', transform=plt.gca().transAxes, bbox=dict(facecolor='black', alpha=0.7, boxstyle='round'))
+
+    plt.title("Uniform Cost Search Path Visualization", fontsize=20, fontweight='bold', color='white', pad=20)
+    plt.axis('off')
+    plt.tight_layout(pad=2.0)
+    plt.show()
+
+
+def visualize_maze(maze, path, start, goal):
+    """Draw a numpy maze with the bidirectional BFS path on top."""
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import ListedColormap
+
+    maze_copy = np.array(maze)
+    fig, ax = plt.subplots(figsize=(10, 10))
+    rows, cols = maze_copy.shape
+    cmap = ListedColormap(['#f8f8ff', '#22223b'])  # light for open, dark for wall
+    ax.imshow(maze_copy, cmap=cmap, origin='upper')
+
+    # Draw the path as a thick colored line
+    if path:
+        path_y = [y + 0.5 for (y, x) in path]
+        path_x = [x + 0.5 for (y, x) in path]
+        ax.plot(path_x, path_y, color='#ffd700', linewidth=8, alpha=0.8, solid_capstyle='round', zorder=3, label='Path')
+        # Overlay path cells for extra highlight
+        for (y, x) in path:
+            ax.add_patch(plt.Rectangle((x, y), 1, 1, color='#ffe066', alpha=0.5, zorder=2))
+
+    # Mark start and goal with larger, distinct markers
+    sy, sx = start
+    gy, gx = goal
+    ax.scatter([sx+0.5], [sy+0.5], s=300, c='#38b000', marker='o', edgecolors='black', linewidths=2, zorder=4, label='Start')
+    ax.scatter([gx+0.5], [gy+0.5], s=300, c='#d90429', marker='*', edgecolors='black', linewidths=2, zorder=4, label='Goal')
+
+    # Set limits, grid, and ticks
+    ax.set_xlim(0, cols)
+    ax.set_ylim(0, rows)
+    ax.set_xticks(np.arange(0, cols+1, 1))
+    ax.set_yticks(np.arange(0, rows+1, 1))
+    ax.grid(which='both', color='#adb5bd', linewidth=1.5, alpha=0.7)
+    ax.invert_yaxis()
+    ax.xaxis.tick_top()
+    ax.set_xticklabels([])
+    ax.set_yticklabels([])
+
+    # Add legend and title
+    handles, labels = ax.get_legend_handles_labels()
+    by_label = dict(zip(labels, handles))
+    ax.legend(by_label.values(), by_label.keys(), loc='upper left', fontsize=14, frameon=True, facecolor='white')
+    ax.set_title('Bidirectional BFS Maze Path', fontsize=22, color='#22223b', pad=20)
+
+    plt.tight_layout()
+    plt.show()
+
+
+def visualize_path(grid, path, start, goal, title="Iterative Deepening Search Path Visualization"):
+    """Draw a list-of-lists grid with a DLS/IDS path."""
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+
+    fig, ax = plt.subplots(figsize=(7, 7))
+    nrows, ncols = len(grid), len(grid[0])
+    ax.set_xticks([x - 0.5 for x in range(1, ncols)], minor=True)
+    ax.set_yticks([y - 0.5 for y in range(1, nrows)], minor=True)
+    ax.grid(which='minor', color='black', linestyle='-', linewidth=2)
+    # Show obstacles as black, free as white
+    ax.imshow(grid, cmap='gray_r', interpolation='none')
+
+    # highlight the path
+    if path:
+        for (x, y) in path:
+            if (x, y) == start:
+                ax.add_patch(plt.Circle((y, x), radius=0.3, color='blue', zorder=3))
+                ax.text(y, x, 'S', color='white', ha='center', va='center', fontsize=14, fontweight='bold', zorder=4)
+            elif (x, y) == goal:
+                ax.add_patch(plt.Circle((y, x), radius=0.3, color='green', zorder=3))
+                ax.text(y, x, 'G', color='white', ha='center', va='center', fontsize=14, fontweight='bold', zorder=4)
+            else:
+                ax.add_patch(plt.Circle((y, x), radius=0.25, color='red', alpha=0.7, zorder=2))
+
+    # highlight obstacles
+    for i in range(nrows):
+        for j in range(ncols):
+            if grid[i][j] == 1:
+                ax.add_patch(plt.Rectangle((j-0.5, i-0.5), 1, 1, color='black', alpha=0.7, zorder=1))
+
+    plt.gca().invert_yaxis()
+    plt.title(title)
+    legend_elements = [
+        mpatches.Patch(facecolor='white', label='Free Space', edgecolor='black'),
+        mpatches.Patch(color='black', label='Obstacle'),
+        mpatches.Patch(color='red', label='Path'),
+        mpatches.Patch(color='blue', label='Start'),
+        mpatches.Patch(color='green', label='Goal')
+    ]
+    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1, 1))
+    plt.tight_layout()
+    plt.show()
+
+
+# colors of the BFS animation
+_BFS_UNVISITED = "#8A8A8A"
+_BFS_FRONTIER = "#F39C12"
+_BFS_VISITED = "#2ECC71"
+_BFS_GOAL = "#9B59B6"        # goal, not found yet
+_BFS_GOAL_FOUND = "#00C2FF"
+_BFS_EDGE = ("#404040", 0.7, 1.6)
+_BFS_EDGE_EXPLORED = ("#00C2FF", 0.95, 2.6)
+
+
+def animate_bfs(graph, positions, start, goal=None, interval=1200, labels=None):
+    """Animate breadth first search over an unweighted adjacency dict.
+
+    All nodes are one scatter collection and all edges one
+    ``LineCollection``.  The search is run once up front with ``bfs_steps``
+    and turned into per-frame lists of the nodes and edges whose color
+    changes, so a frame only rewrites those entries of the color arrays
+    and the animation is blitted.  Node labels are drawn when ``labels`` is
+    true, by default only for graphs of up to 200 nodes since every label is
+    redrawn each frame.  The frames match the ``bfs_states`` snapshots.
+    """
+    import matplotlib.patheffects as pe
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba
+
+    from .bfs import bfs_steps
+
+    nodes = list(positions)
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.array([positions[node] for node in nodes], dtype=float).reshape(-1, 2)
+
+    #one entry per undirected edge
+    edge_index = {}
+    pairs = []
+    for u in graph:
+        for v in graph[u]:
+            if (u, v) in edge_index:
+                continue
+            edge_index[u, v] = edge_index[v, u] = len(pairs)
+            pairs.append((index[u], index[v]))
+    pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+    fig, ax = plt.subplots()
+    fig.patch.set_facecolor('black')
+    ax.set_facecolor('black')
+    ax.set_aspect('equal')
+    ax.axis('off')
+    if goal is None:
+        ax.set_title('BFS Traversal Animation', color='white')
+    else:
+        ax.set_title(f'BFS: start={start}, goal={goal}', color='white')
+    # the status line lives inside the axes so blitting redraws it cleanly
+    status = ax.text(0.5, 0.98, '', transform=ax.transAxes, color='white', ha='center', va='top',
+                     animated=True)
+
+    node_rgba = np.array([to_rgba(_BFS_UNVISITED)] * len(nodes)).reshape(-1, 4)
+    edge_rgba = np.array([to_rgba(_BFS_EDGE[0], _BFS_EDGE[1])] * len(pairs)).reshape(-1, 4)
+    edge_width = np.full(len(pairs), _BFS_EDGE[2])
+    palette = {color: np.array(to_rgba(color)) for color in
+               (_BFS_UNVISITED, _BFS_FRONTIER, _BFS_VISITED, _BFS_GOAL, _BFS_GOAL_FOUND)}
+    explored_rgba = np.array(to_rgba(_BFS_EDGE_EXPLORED[0], _BFS_EDGE_EXPLORED[1]))
+
+    lines = LineCollection(xy[pairs], colors=edge_rgba, linewidths=edge_width, zorder=1, animated=True)
+    ax.add_collection(lines)
+    #slightly scaled by degree for readability
+    sizes = [260 + 35 * len(graph.get(node, ())) for node in nodes]
+    outline = ['#FF4DFF' if node == goal else 'white' for node in nodes]
+    widths = [2.6 if node == goal else 1.2 for node in nodes]
+    points = ax.scatter(xy[:, 0], xy[:, 1], s=sizes, c=node_rgba, edgecolors=outline, linewidths=widths,
+                        zorder=2, animated=True)
+    artists = [lines, points, status]
+    if labels is None:
+        labels = len(nodes) <= 200
+    if labels:
+        for node, (x, y) in zip(nodes, xy):
+            label = ax.text(x, y, str(node), color='white', fontsize=10, ha='center', va='center', zorder=3,
+                            animated=True)
+            label.set_path_effects([pe.Stroke(linewidth=3, foreground='black'), pe.Normal()])
+            artists.append(label)
+
+    # keep a consistent view box with padding
+    pad = 2.8
+    if len(nodes):
+        ax.set_xlim(xy[:, 0].min() - pad, xy[:, 0].max() + pad)
+        ax.set_ylim(xy[:, 1].min() - pad, xy[:, 1].max() + pad)
+
+    def node_color(node, state):
+        if node == goal:
+            return _BFS_GOAL_FOUND if state == _BFS_VISITED else _BFS_GOAL
+        return state
+
+    searching = '' if goal is None else f'BFS: searching for goal {goal}…'
+    found = f'BFS: goal {goal} FOUND'
+    initial = [(index[node], node_color(node, _BFS_UNVISITED)) for node in (goal,) if node in index]
+    initial.append((index[start], node_color(start, _BFS_FRONTIER)))
+
+    # frames[i] = (node color changes, newly explored edges, status text or None);
+    # every expansion is two bfs_states snapshots, before and after it
+    frames = []
+    if goal is not None and start == goal:
+        frames.append(([(index[start], _BFS_GOAL_FOUND)], [], found))
+    else:
+        frames.append(([], [], searching))
+        for node, adjacent, queued in bfs_steps(graph, start, goal):
+            if frames[-1][0] or frames[-1][1]:
+                frames.append(([], [], None))
+            changes = [(index[node], node_color(node, _BFS_VISITED))]
+            changes.extend((index[n], node_color(n, _BFS_FRONTIER)) for n in queued)
+            explored = [edge_index[node, n] for n in adjacent]
+            frames.append((changes, explored, found if node == goal else None))
+
+    def init():
+        node_rgba[:] = palette[_BFS_UNVISITED]
+        edge_rgba[:] = to_rgba(_BFS_EDGE[0], _BFS_EDGE[1])
+        edge_width[:] = _BFS_EDGE[2]
+        for i, color in initial:
+            node_rgba[i] = palette[color]
+        points.set_facecolor(node_rgba)
+        lines.set_color(edge_rgba)
+        lines.set_linewidth(edge_width)
+        status.set_text(searching)
+        return artists
+
+    def update(frame):
+        changes, explored, text = frames[frame]
+        if changes:
+            for i, color in changes:
+                node_rgba[i] = palette[color]
+            points.set_facecolor(node_rgba)
+        if explored:
+            edge_rgba[explored] = explored_rgba
+            edge_width[explored] = _BFS_EDGE_EXPLORED[2]
+            lines.set_color(edge_rgba)
+            lines.set_linewidth(edge_width)
+        if text is not None:
+            status.set_text(text)
+        return artists
+
+    ani = FuncAnimation(fig, update, frames=len(frames), init_func=init, interval=interval, blit=True,
+                        repeat=False)
+    plt.show()
+    return ani
+
+
+def animate_dfs(graph, start, pause=3.0, every=1, labels=None, cache=None):
+    """Step through ``dfs_with_trace`` on a directed adjacency dict.
+
+    The edges, nodes, labels and legend are drawn once; each step only
+    updates the face colors of the nodes it touches and the title.  The
+    figure is shown every ``every`` steps (and after the last one) for
+    ``pause`` seconds, so long traversals can be played back quickly.
+    Labels and edge arrows are drawn by default only for graphs of up to
+    200 nodes and 500 edges.  Pass a ``layout_cache.LayoutCache`` as
+    ``cache`` to reuse the spring layout between runs.
+    """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    from matplotlib.colors import to_rgba
+    from matplotlib.patches import Patch
+
+    from .dfs import dfs_with_trace
+
+    G = nx.DiGraph()
+    for node in graph:
+        G.add_node(node)
+        for neighbour in graph[node]:
+            G.add_edge(node, neighbour)
+
+    def spring(initial, fixed):
+        # a warm start from a cached layout only settles the changed part
+        return nx.spring_layout(G, pos=initial, fixed=fixed or None, seed=42, k=2.2,
+                                iterations=400 if initial is None else 80, scale=3.0)
+
+    if cache is None:
+        pos = spring(None, None)
+    else:
+        pos = cache.layout(graph, "spring", spring, seed=42, k=2.2, iterations=400, scale=3.0)
+
+    plt.style.use("dark_background")
+    plt.ion()
+    fig, ax = plt.subplots(figsize=(13, 8))
+    fig.patch.set_facecolor("black")
+    ax.set_facecolor("black")
+    ax.set_axis_off()
+
+    visited_color = "#22c55e"   # green
+    frontier_color = "#60a5fa"  # blue
+    current_color = "#f59e0b"   # amber
+    default_color = "#334155"   # slate
+
+    if G.number_of_edges() <= 500:
+        arrow_style = dict(arrows=True, arrowstyle="-|>", arrowsize=18, connectionstyle="arc3,rad=0.12")
+    else:
+        # one LineCollection instead of a patch per edge
+        arrow_style = dict(arrows=False)
+    nx.draw_networkx_edges(G, pos=pos, ax=ax, width=2, edge_color="#94a3b8", **arrow_style)
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    colors = np.array([to_rgba(default_color)] * len(nodes)).reshape(-1, 4)
+    node_artist = nx.draw_networkx_nodes(G, pos=pos, ax=ax, nodelist=nodes, node_color=colors, node_size=1500,
+                                         linewidths=2, edgecolors="#e2e8f0")
+    if labels is None:
+        labels = len(nodes) <= 200
+    if labels:
+        nx.draw_networkx_labels(G, pos=pos, ax=ax, font_size=14, font_weight="bold", font_color="#f8fafc")
+
+    legend_items = [
+        Patch(facecolor=current_color, edgecolor="#334155", label="Current"),
+        Patch(facecolor=visited_color, edgecolor="#334155", label="Visited"),
+        Patch(facecolor=frontier_color, edgecolor="#334155", label="In stack"),
+        Patch(facecolor=default_color, edgecolor="#334155", label="Unseen"),
+    ]
+    ax.legend(handles=legend_items, loc="center left", bbox_to_anchor=(1.02, 0.5), frameon=True,
+              framealpha=0.95, facecolor="#0b1220", edgecolor="#94a3b8", labelcolor="#f8fafc")
+    title = ax.set_title("DFS Traversal", fontsize=14, fontweight="bold", color="#f8fafc")
+    # Leave room on the right for the legend so it never covers nodes.
+    plt.tight_layout(rect=[0, 0, 0.82, 1])
+
+    rgba = {color: np.array(to_rgba(color))
+            for color in (visited_color, frontier_color, current_color, default_color)}
+    in_stack = {start: 1}   # node -> number of stack entries
+    previous = None
+    step = 0
+    stack_size = 1
+    for current, order, stack, visited in dfs_with_trace(graph, start):
+        step += 1
+        # the step popped ``current`` and pushed everything above the old top
+        in_stack[current] -= 1
+        pushed = stack[stack_size - 1:]
+        stack_size = len(stack)
+        for node in pushed:
+            in_stack[node] = in_stack.get(node, 0) + 1
+
+        for node in {previous, current, *pushed} - {None}:
+            if node == current:
+                color = current_color
+            elif node in visited:
+                color = visited_color
+            elif in_stack.get(node):
+                color = frontier_color
+            else:
+                color = default_color
+            colors[index[node]] = rgba[color]
+        previous = current
+
+        if step % every and stack:
+            continue
+        node_artist.set_facecolor(colors)
+        title.set_text(
+            f"DFS Traversal (step {step})\n"
+            f"Order: {_tail(order)}   |   Stack: {_tail(stack)}"
+        )
+        if pause > 0:
+            plt.pause(pause)
+        else:
+            fig.canvas.draw_idle()
+            fig.canvas.flush_events()
+
+    plt.ioff()
+    plt.show()
+
+
+def _tail(items, limit=20):
+    # the end of a long list for a one-line title
+    if len(items) <= limit:
+        return str(list(items))
+    return "[…, " + str(list(items[-limit:]))[1:]